@@ -0,0 +1,93 @@
+import json
+import re
+
+import pytest
+import requests
+
+from who_edited import cache
+from who_edited.platform_integration import GitHubAPI
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.status_code = 200
+        self.headers = {}
+        self.links = {}
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+def _comment(body):
+    return {
+        "body": body,
+        "author": {"login": "alice"},
+        "line": 3,
+        "originalLine": 3,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "url": f"https://github.com/o/r/pull/1#{body}",
+        "path": "app.py",
+    }
+
+
+def _pull_request(number, truncated):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "reviewThreads": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [{"comments": {"pageInfo": {"hasNextPage": truncated}, "nodes": [_comment(f"graphql-{number}")]}}],
+        },
+    }
+
+
+@pytest.fixture
+def github(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "HTTP_CACHE_DIR", tmp_path)
+    calls = []
+
+    def request(self, method, url, json=None, **kwargs):
+        calls.append((method, url))
+        if method == "POST":
+            query = json["query"]
+            if "associatedPullRequests" in query:
+                # The first commit was never pushed; the rest all map to PRs 1 and 2
+                aliases = re.findall(r"(c\d+): object", query)
+                return FakeResponse({"data": {"repository": {
+                    alias: {"associatedPullRequests": {"nodes": [{"number": 1}, {"number": 2}]}} if alias != "c0" else None
+                    for alias in aliases
+                }}})
+            aliases = re.findall(r"(p\d+): pullRequest\(number: (\d+)\)", query)
+            return FakeResponse({"data": {"repository": {
+                alias: _pull_request(int(number), truncated=number == "2") for alias, number in aliases
+            }}})
+        return FakeResponse([
+            {"body": f"rest-{i}", "user": {"login": "bob"}, "line": 3, "created_at": "2024-01-01T00:00:00Z",
+             "html_url": f"https://github.com/o/r/pull/2#{i}", "path": "app.py"}
+            for i in range(3)
+        ])
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    with GitHubAPI("token") as api:
+        yield api, calls
+
+
+def test_review_comments_for_commits_dedupes_pull_requests(github):
+    api, calls = github
+    results = api.get_review_comments_for_commits("o", "r", ["a" * 40, "b" * 40, "c" * 40])
+
+    assert [pr["number"] for pr, _ in results] == [1, 2]
+    assert [c["body"] for c in results[0][1]] == ["graphql-1"]
+    assert results[0][1][0]["user"] == {"login": "alice"}
+    # One query to map the commits to PRs, one for the PRs' review threads
+    assert [method for method, _ in calls].count("POST") == 2
+
+
+def test_truncated_review_threads_fall_back_to_rest(github):
+    api, calls = github
+    results = api.get_review_comments_for_commits("o", "r", ["a" * 40, "b" * 40])
+
+    assert [c["body"] for c in results[1][1]] == ["rest-0", "rest-1", "rest-2"]
+    assert ("GET", "https://api.github.com/repos/o/r/pulls/2/comments") in calls
+    assert not any(url.endswith("/pulls/1/comments") for _, url in calls)
@@ -4,16 +4,51 @@ import os
 import json
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional, Union
-from collections import defaultdict
+from collections import Counter
 import re
+import heapq
 from datetime import datetime, timedelta
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 
-from who_edited.git_tools import run_git_command
+from who_edited import cache
+from who_edited.git_tools import run_git_command, run_git_command_stream, get_head_sha
 from who_edited.analytics import calculate_code_ownership
 
 
+# Commit message classifiers, compiled once at import time. Matching is
+# case-insensitive so messages can be scanned without lowercasing them first.
+_MSG_PATTERNS = {
+    "fix": re.compile(r'\bfix(?:ed|es|ing)?\b', re.IGNORECASE),
+    "feature": re.compile(r'\b(?:feature|feat)\b', re.IGNORECASE),
+    "refactor": re.compile(r'\brefactor(?:ing|ed)?\b', re.IGNORECASE),
+    "docs": re.compile(r'\bdoc(?:s|umentation)?\b', re.IGNORECASE),
+    "test": re.compile(r'\btest(?:s|ing)?\b', re.IGNORECASE),
+    "style": re.compile(r'\bstyle\b', re.IGNORECASE),
+    "deps": re.compile(r'\b(?:dependencies|deps)\b', re.IGNORECASE),
+}
+# All classifiers fused into one alternation so each message is scanned once
+_MSG_CLASSIFIER = re.compile("|".join(
+    f"(?P<{name}>{pattern.pattern})" for name, pattern in _MSG_PATTERNS.items()
+), re.IGNORECASE)
+_QUICK_FIX_RE = re.compile(r'\b(?:hotfix|quick fix|emergency|urgent)\b', re.IGNORECASE)
+_WORD_RE = re.compile(r'\b[a-z][a-z0-9]{2,}\b')
+_STOPWORDS = frozenset({'the', 'and', 'for', 'with', 'this', 'that', 'from'})
+
+# Source files sampled for content-based reviewer suggestions, and read caps
+# that keep the TF-IDF vocabulary bounded
+_CODE_EXTS = frozenset({
+    '.py', '.js', '.jsx', '.ts', '.tsx', '.java', '.kt', '.go', '.rs',
+    '.c', '.cpp', '.h', '.hpp', '.rb', '.cs', '.php', '.swift',
+})
+_SAMPLE_BYTES = 32 * 1024
+_AUTHOR_SAMPLE_BYTES = 128 * 1024
+
+# Worker count for fanning out independent git subprocesses
+_GIT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+
 def get_commit_frequency_patterns(repo_path: str, author: Optional[str] = None, days: int = 90) -> Dict[str, Any]:
     """
     Analyze an author's commit frequency patterns.
@@ -28,56 +63,62 @@ def get_commit_frequency_patterns(repo_path: str, author: Optional[str] = None,
     """
     since_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
     
-    git_cmd = ["git", "log", f"--since={since_date}", "--format=%an|%ad|%s", "--date=iso"]
+    # Unix timestamp plus the author's UTC offset (e.g. "+0200")
+    git_cmd = ["git", "log", f"--since={since_date}", "--format=%an|%at|%ad|%s", "--date=format:%z"]
     if author:
         git_cmd.extend(["--author", author])
         
-    output = run_git_command(git_cmd, cwd=repo_path)
-    
-    commit_data = []
-    for line in output.splitlines():
+    authors = []
+    timestamps = []
+    offsets = []
+    for line in run_git_command_stream(git_cmd, cwd=repo_path):
         if "|" in line:
-            parts = line.split("|")
-            if len(parts) >= 3:
-                author_name = parts[0]
-                commit_date = datetime.fromisoformat(parts[1].strip().replace(" ", "T").replace(" -", "-").split(" +")[0])
-                commit_data.append((author_name, commit_date))
-    
-    if not commit_data:
+            parts = line.split("|", 3)
+            if len(parts) >= 4:
+                authors.append(parts[0])
+                timestamps.append(int(parts[1]))
+                tz = parts[2]
+                offsets.append(int(tz[0] + "1") * (int(tz[1:3]) * 3600 + int(tz[3:5]) * 60))
+    
+    if not timestamps:
         return {"error": "No commit data found"}
     
+    timestamps = np.array(timestamps, dtype=np.int64)
+    # Day and hour buckets use the commit's local wall-clock time
+    dates = (timestamps + np.array(offsets, dtype=np.int64)).astype("datetime64[s]")
+    commit_days = dates.astype("datetime64[D]")
+    # 1970-01-01 was a Thursday (weekday 3)
+    weekdays = (commit_days.astype(np.int64) + 3) % 7
+    hours = (dates - commit_days).astype("timedelta64[h]").astype(np.int64)
+    
     # Group commits by day of week
     days_of_week = {0: "Monday", 1: "Tuesday", 2: "Wednesday", 3: "Thursday", 4: "Friday", 5: "Saturday", 6: "Sunday"}
-    day_counts = defaultdict(int)
-    hour_counts = defaultdict(int)
+    day_counts = Counter(days_of_week[weekday] for weekday in weekdays.tolist())
+    hour_counts = Counter(hours.tolist())
     
-    for _, commit_date in commit_data:
-        day_counts[days_of_week[commit_date.weekday()]] += 1
-        hour_counts[commit_date.hour] += 1
-    
-    # Calculate time between commits
-    author_commits = defaultdict(list)
-    for author_name, commit_date in commit_data:
-        author_commits[author_name].append(commit_date)
+    # Calculate time between commits: sort by (author, date) and split on author boundaries
+    author_index = {}
+    author_ids = np.array([author_index.setdefault(name, len(author_index)) for name in authors])
+    order = np.lexsort((timestamps, author_ids))
+    sorted_ids = author_ids[order]
+    boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
     
+    author_names = list(author_index)
     time_between_commits = {}
-    for author_name, dates in author_commits.items():
-        if len(dates) <= 1:
+    for block in np.split(order, boundaries):
+        if len(block) <= 1:
             continue
             
-        sorted_dates = sorted(dates)
-        diffs = [(sorted_dates[i+1] - sorted_dates[i]).total_seconds() / 3600 for i in range(len(sorted_dates)-1)]
-        
-        if diffs:
-            time_between_commits[author_name] = {
-                "mean_hours": np.mean(diffs),
-                "median_hours": np.median(diffs),
-                "min_hours": min(diffs),
-                "max_hours": max(diffs)
-            }
+        diffs = np.diff(timestamps[block]).astype(np.float64) / 3600.0
+        time_between_commits[author_names[author_ids[block[0]]]] = {
+            "mean_hours": diffs.mean(),
+            "median_hours": np.median(diffs),
+            "min_hours": diffs.min(),
+            "max_hours": diffs.max()
+        }
     
     return {
-        "total_commits": len(commit_data),
+        "total_commits": len(timestamps),
         "days_analyzed": days,
         "commits_by_day": dict(sorted(day_counts.items())),
         "commits_by_hour": dict(sorted(hour_counts.items())),
@@ -101,14 +142,14 @@ def analyze_commit_messages(repo_path: str, author: Optional[str] = None, count:
     if author:
         git_cmd.extend(["--author", author])
         
-    output = run_git_command(git_cmd, cwd=repo_path)
+    output = run_git_command(git_cmd, cwd=repo_path, binary=True)
     
     messages = []
-    for line in output.splitlines():
-        if "|" in line:
-            parts = line.split("|")
+    for line in output.split(b"\n"):
+        if b"|" in line:
+            parts = line.split(b"|")
             if len(parts) >= 2:
-                messages.append(parts[1])
+                messages.append(parts[1].decode("utf-8", "replace"))
     
     if not messages:
         return {"error": "No commit messages found"}
@@ -116,24 +157,13 @@ def analyze_commit_messages(repo_path: str, author: Optional[str] = None, count:
     # Calculate message length statistics
     lengths = [len(msg) for msg in messages]
     
-    # Detect common patterns
-    patterns = {
-        "fix": len([m for m in messages if re.search(r'\bfix(ed|es|ing)?\b', m.lower())]),
-        "feature": len([m for m in messages if re.search(r'\b(feature|feat)\b', m.lower())]),
-        "refactor": len([m for m in messages if re.search(r'\brefactor(ing|ed)?\b', m.lower())]),
-        "docs": len([m for m in messages if re.search(r'\bdoc(s|umentation)?\b', m.lower())]),
-        "test": len([m for m in messages if re.search(r'\btest(s|ing)?\b', m.lower())]),
-        "style": len([m for m in messages if re.search(r'\bstyle\b', m.lower())]),
-        "deps": len([m for m in messages if re.search(r'\b(dependencies|deps)\b', m.lower())]),
-    }
-    
-    # Find common words
-    all_words = " ".join(messages).lower()
-    word_counts = defaultdict(int)
-    
-    for word in re.findall(r'\b[a-z][a-z0-9]{2,}\b', all_words):
-        if word not in ['the', 'and', 'for', 'with', 'this', 'that', 'from']:
-            word_counts[word] += 1
+    # Detect common patterns and find common words, one message at a time
+    patterns = dict.fromkeys(_MSG_PATTERNS, 0)
+    word_counts = Counter()
+    for m in messages:
+        for name in {match.lastgroup for match in _MSG_CLASSIFIER.finditer(m)}:
+            patterns[name] += 1
+        word_counts.update(word for word in _WORD_RE.findall(m.lower()) if word not in _STOPWORDS)
     
     return {
         "total_messages": len(messages),
@@ -144,7 +174,7 @@ def analyze_commit_messages(repo_path: str, author: Optional[str] = None, count:
             "max": max(lengths)
         },
         "common_patterns": patterns,
-        "common_words": dict(sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[:10])
+        "common_words": dict(word_counts.most_common(10))
     }
 
 
@@ -161,10 +191,15 @@ def identify_risky_changes(file_path: str) -> Dict[str, Any]:
     file_path = Path(file_path).resolve()
     repo_dir = file_path.parent
     
-    # Get file history
+    # Get file history with per-commit line counts in a single git call.
+    # Each record starts with \x1e; header fields are separated by \x1f and
+    # followed by "added<TAB>deleted<TAB>path" numstat lines. Authors are
+    # identified by email so name variants of one person are not double counted.
     output = run_git_command(
-        ["git", "log", "--follow", "--name-status", file_path.name],
-        cwd=repo_dir
+        ["git", "log", "--follow", "--numstat",
+         "--format=%x1e%H%x1f%ae%x1f%ad%x1f%s", "--", file_path.name],
+        cwd=repo_dir,
+        binary=True
     )
     
     # Look for potential risk indicators in commit history
@@ -175,74 +210,47 @@ def identify_risky_changes(file_path: str) -> Dict[str, Any]:
         "multiple_authors": set()
     }
     
-    commit_data = []
-    current_commit = {}
-    
-    for line in output.splitlines():
-        if line.startswith("commit "):
-            if current_commit:
-                commit_data.append(current_commit)
-                
-            current_commit = {"hash": line.split()[1]}
-            
-        elif line.startswith("Author: "):
-            current_commit["author"] = line[8:].strip()
-            risk_indicators["multiple_authors"].add(current_commit["author"])
-            
-        elif line.startswith("Date: "):
-            current_commit["date"] = line[6:].strip()
-            
-        elif line and ":" not in line and not line.startswith(" "):
-            message = line.strip()
-            current_commit["message"] = message
-            
-            # Check for quick fix indicators in commit message
-            if re.search(r'\b(hotfix|quick fix|emergency|urgent)\b', message.lower()):
-                risk_indicators["quick_fixes"].append({
-                    "hash": current_commit["hash"],
-                    "message": message,
-                    "date": current_commit.get("date", "")
-                })
-                
-        elif line.startswith(("M", "A", "D")):
-            current_commit["change_type"] = line[0]
-    
-    # Add the last commit
-    if current_commit:
-        commit_data.append(current_commit)
-    
-    # Get file change sizes
-    for commit in commit_data:
-        hash_value = commit.get("hash")
-        if not hash_value:
+    for record in output.split(b"\x1e"):
+        if not record.strip():
             continue
             
-        # Get the diff stats for this commit for this file
-        try:
-            stat_output = run_git_command(
-                ["git", "show", "--stat", hash_value, "--", file_path.name],
-                cwd=repo_dir
-            )
+        # Only the short header is decoded; numstat lines are parsed as bytes
+        header, _, stats = record.partition(b"\n")
+        fields = header.decode("utf-8", "replace").split("\x1f", 3)
+        if len(fields) < 4:
+            continue
+        hash_value, author_email, date, message = fields
+        risk_indicators["multiple_authors"].add(author_email.lower())
+        
+        # Check for quick fix indicators in commit message
+        if _QUICK_FIX_RE.search(message):
+            risk_indicators["quick_fixes"].append({
+                "hash": hash_value,
+                "message": message,
+                "date": date
+            })
             
-            # Parse lines added/removed
-            match = re.search(r'(\d+) insertion.+?(\d+) deletion', stat_output)
-            if match:
-                insertions = int(match.group(1))
-                deletions = int(match.group(2))
-                total_changes = insertions + deletions
+        # Sum lines added/removed; binary files report "-" and are skipped
+        insertions = deletions = 0
+        for stat_line in stats.split(b"\n"):
+            added, _, rest = stat_line.partition(b"\t")
+            deleted = rest.partition(b"\t")[0]
+            if added.isdigit() and deleted.isdigit():
+                insertions += int(added)
+                deletions += int(deleted)
                 
-                # Consider large changes (more than 100 lines changed)
-                if total_changes > 100:
-                    risk_indicators["large_changes"].append({
-                        "hash": hash_value,
-                        "insertions": insertions,
-                        "deletions": deletions,
-                        "total": total_changes,
-                        "message": commit.get("message", ""),
-                        "date": commit.get("date", "")
-                    })
-        except Exception:
-            pass  # Skip if we can't get diff stats
+        total_changes = insertions + deletions
+        
+        # Consider large changes (more than 100 lines changed)
+        if total_changes > 100:
+            risk_indicators["large_changes"].append({
+                "hash": hash_value,
+                "insertions": insertions,
+                "deletions": deletions,
+                "total": total_changes,
+                "message": message,
+                "date": date
+            })
     
     # Overall risk assessment
     risk_score = 0
@@ -293,6 +301,121 @@ def generate_recommendations(risk_indicators: Dict[str, Any]) -> List[str]:
     return recommendations
 
 
+def clear_cache() -> None:
+    """Clear the in-memory blame, author and ownership caches."""
+    _cached_ownership.cache_clear()
+    _get_author_last_commits.cache_clear()
+    _get_blame_porcelain.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _cached_ownership(repo_path: str, threshold: float, head_sha: str) -> Dict[str, float]:
+    """Memoize repository ownership; `head_sha` invalidates the entry when HEAD moves."""
+    return calculate_code_ownership(repo_path, threshold=threshold)
+
+
+def _get_files_touched_by(repo_path: str, author: str) -> Optional[List[str]]:
+    """Get the distinct source files touched by an author's recent commits."""
+    try:
+        files_output = run_git_command(
+            ["git", "log", "--author", author, "--name-only", "--format=", "--max-count=100"],
+            cwd=repo_path
+        )
+    except Exception:
+        return None
+    # Most recently touched first, so the sampled files are stable across runs
+    return list(dict.fromkeys(
+        line for line in files_output.splitlines()
+        if line.strip() and Path(line).suffix in _CODE_EXTS
+    ))
+
+
+def _read_file_sample(repo_path: str, file_path: str) -> Optional[str]:
+    """Read the head of a file from the working tree, falling back to its content at HEAD."""
+    try:
+        try:
+            full_path = os.path.join(repo_path, file_path)
+            if os.path.exists(full_path) and os.path.isfile(full_path):
+                with open(full_path, 'rb') as f:
+                    return f.read(_SAMPLE_BYTES).decode('utf-8', 'ignore')
+        except Exception:
+            # Get file content from git if the file doesn't exist locally
+            return run_git_command(
+                ["git", "show", f"HEAD:{file_path}"],
+                cwd=repo_path
+            )[:_SAMPLE_BYTES]
+    except Exception:
+        pass
+    return None
+
+
+@lru_cache(maxsize=32)
+def _get_author_last_commits(repo_path: str, head_sha: str) -> Dict[str, str]:
+    """Map each author to their most recent commit, ordered by commit count like shortlog."""
+    output = run_git_command(
+        ["git", "log", "--format=%H%x1f%aN <%aE>", "HEAD"],
+        cwd=repo_path
+    )
+    
+    commit_counts = Counter()
+    last_shas = {}
+    for line in output.splitlines():
+        sha, _, author = line.partition("\x1f")
+        if author:
+            commit_counts[author] += 1
+            last_shas.setdefault(author, sha)
+            
+    return {
+        author: last_shas[author]
+        for author in sorted(commit_counts, key=lambda a: (-commit_counts[a], a))
+    }
+
+
+def _get_author_content_sample(repo_path: str, author: str, head_sha: str) -> Optional[str]:
+    """
+    Concatenate samples of the source files an author recently touched.
+    
+    Cached on disk per HEAD; the sampled files' mtimes are part of the key because
+    samples are read from the working tree.
+    """
+    files = cache.get(repo_path, head_sha, f"files_touched:{author}")
+    if files is None:
+        files = _get_files_touched_by(repo_path, author)
+        if files is None:
+            return None
+        cache.put(repo_path, head_sha, f"files_touched:{author}", files)
+    files = files[:5]  # Limit to 5 files per author for performance
+    if not files:
+        return None
+
+    mtimes = []
+    for file_path in files:
+        try:
+            mtimes.append(os.stat(os.path.join(repo_path, file_path)).st_mtime_ns)
+        except OSError:
+            # Read from HEAD instead, which head_sha already covers
+            mtimes.append(0)
+    cache_key = f"author_sample:{author}:{','.join(map(str, mtimes))}"
+    cached = cache.get(repo_path, head_sha, cache_key)
+    if cached is not None:
+        return cached or None
+
+    content_samples = []
+    total_bytes = 0
+    for file_path in files:
+        content = _read_file_sample(repo_path, file_path)
+        if content is None:
+            continue
+        content_samples.append(content)
+        total_bytes += len(content)
+        if total_bytes >= _AUTHOR_SAMPLE_BYTES:
+            break
+            
+    sample = "\n".join(content_samples)
+    cache.put(repo_path, head_sha, cache_key, sample)
+    return sample or None
+
+
 def suggest_reviewers_by_content(repo_path: str, file_content: str, exclude_authors: List[str] = None) -> List[Dict[str, Any]]:
     """
     Suggest reviewers based on content similarity to their previous work.
@@ -308,63 +431,24 @@ def suggest_reviewers_by_content(repo_path: str, file_content: str, exclude_auth
     if exclude_authors is None:
         exclude_authors = []
         
-    # Get list of authors
-    output = run_git_command(
-        ["git", "shortlog", "-sne", "HEAD"],
-        cwd=repo_path
-    )
-    
-    authors = []
-    for line in output.splitlines():
-        parts = line.strip().split("\t")
-        if len(parts) >= 2:
-            author = parts[1].strip()
-            if author not in exclude_authors:
-                authors.append(author)
+    # Get list of authors, most active first
+    repo_key = str(Path(repo_path).resolve())
+    head_sha = get_head_sha(repo_key)
+    last_shas = _get_author_last_commits(repo_key, head_sha)
+    authors = [author for author in last_shas if author not in exclude_authors]
     
     if not authors:
         return []
     
-    # Get a sample of files touched by each author
-    author_files = {}
-    
-    for author in authors:
-        try:
-            # Get files touched by this author
-            files_output = run_git_command(
-                ["git", "log", "--author", author, "--name-only", "--format=", "--max-count=100"],
-                cwd=repo_path
-            )
-            
-            author_files[author] = list(set(line for line in files_output.splitlines() if line.strip()))
-        except Exception:
-            continue
-    
-    # Collect file contents for similarity comparison
-    author_content = {}
-    
-    for author, files in author_files.items():
-        content_samples = []
-        
-        for file_path in files[:5]:  # Limit to 5 files per author for performance
-            try:
-                try:
-                    full_path = os.path.join(repo_path, file_path)
-                    if os.path.exists(full_path) and os.path.isfile(full_path):
-                        with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content_samples.append(f.read())
-                except Exception:
-                    # Get file content from git if the file doesn't exist locally
-                    content = run_git_command(
-                        ["git", "show", f"HEAD:{file_path}"],
-                        cwd=repo_path
-                    )
-                    content_samples.append(content)
-            except Exception:
-                continue
-                
-        if content_samples:
-            author_content[author] = "\n".join(content_samples)
+    # Git calls are I/O-bound and release the GIL, so fan them out over a thread pool
+    with ThreadPoolExecutor(max_workers=_GIT_WORKERS) as executor:
+        samples = executor.map(
+            lambda author: _get_author_content_sample(repo_key, author, head_sha),
+            authors
+        )
+        author_content = {
+            author: content for author, content in zip(authors, samples) if content
+        }
     
     # Calculate content similarity using TF-IDF
     if not author_content:
@@ -372,31 +456,39 @@ def suggest_reviewers_by_content(repo_path: str, file_content: str, exclude_auth
         
     try:
         # Create document corpus with author samples and the target file
-        documents = list(author_content.values())
-        documents.append(file_content)
+        authors_list, documents = zip(*author_content.items())
+        documents = [*documents, file_content]
         
-        # Create TF-IDF vectors
-        vectorizer = TfidfVectorizer(analyzer='word', ngram_range=(1, 3), min_df=2, stop_words='english')
-        tfidf_matrix = vectorizer.fit_transform(documents)
+        # Create TF-IDF vectors. Hashing skips building a vocabulary and keeps the
+        # column space fixed regardless of corpus size.
+        vectorizer = HashingVectorizer(
+            analyzer='word',
+            ngram_range=(1, 2),
+            n_features=2 ** 18,
+            alternate_sign=False,
+            norm=None,
+            stop_words='english',
+            dtype=np.float32,
+        )
+        tfidf_matrix = TfidfTransformer(sublinear_tf=True).fit_transform(vectorizer.transform(documents))
         
-        # Compare similarity of the target file to each author's content
+        # Compare similarity of the target file to each author's content. Rows are
+        # already L2-normalized, so cosine similarity is a single sparse mat-vec.
         target_vector = tfidf_matrix[-1]
         author_vectors = tfidf_matrix[:-1]
         
-        similarity_scores = cosine_similarity(target_vector, author_vectors).flatten()
+        similarity_scores = (author_vectors @ target_vector.T).toarray().ravel()
         
-        # Create list of authors with similarity scores
-        authors_list = list(author_content.keys())
-        similarity_results = [(authors_list[i], float(similarity_scores[i])) for i in range(len(authors_list))]
+        # Pair authors with similarity scores and keep the top 3 matches
+        similarity_results = zip(authors_list, similarity_scores.tolist())
+        top_matches = heapq.nlargest(3, similarity_results, key=lambda x: x[1])
         
-        # Sort by similarity score
-        similarity_results.sort(key=lambda x: x[1], reverse=True)
+        # Get additional expertise info once for all candidates
+        ownership = _cached_ownership(repo_path, 0.01, get_head_sha(repo_path))
         
         # Return top matches with additional info
         result = []
-        for author, score in similarity_results[:3]:  # Top 3 matches
-            # Get additional expertise info
-            ownership = calculate_code_ownership(repo_path, threshold=0.01)
+        for author, score in top_matches:
             expertise = ownership.get(author, 0) * 100  # Convert to percentage
             
             result.append({
@@ -413,6 +505,17 @@ def suggest_reviewers_by_content(repo_path: str, file_content: str, exclude_auth
         return []
 
 
+@lru_cache(maxsize=256)
+def _get_blame_porcelain(repo_path: str, file_name: str, line_start: int, line_end: int,
+                         head_sha: str, mtime_ns: int) -> bytes:
+    """Blame a line range; `head_sha` and `mtime_ns` invalidate the entry on new commits or edits."""
+    return run_git_command(
+        ["git", "blame", f"-L{line_start},{line_end}", "-w", "-p", file_name],
+        cwd=repo_path,
+        binary=True
+    )
+
+
 def get_expert_for_code_area(repo_path: str, file_path: str, line_start: int, line_end: int) -> List[Dict[str, Any]]:
     """
     Find the expert for a specific area of code.
@@ -430,32 +533,44 @@ def get_expert_for_code_area(repo_path: str, file_path: str, line_start: int, li
     
     try:
         # Get blame for the specific line range
-        blame_output = run_git_command(
-            ["git", "blame", f"-L{line_start},{line_end}", "-w", "-p", file_path.name],
-            cwd=repo_path
+        blame_output = _get_blame_porcelain(
+            str(repo_path), file_path.name, line_start, line_end,
+            get_head_sha(repo_path), file_path.stat().st_mtime_ns
         )
         
-        author_lines = {}
-        current_author = None
+        # Porcelain output only prints the author block the first time a commit
+        # appears, so remember each commit's author and count the tab-prefixed
+        # content lines, each of which follows a "<sha> <orig> <final>" header.
+        # Only author names are decoded; everything else stays as bytes.
+        author_lines = Counter()
+        commit_authors = {}
+        current_sha = None
+        expect_header = True
+        
+        for line in blame_output.split(b"\n"):
+            if expect_header:
+                current_sha = line.split(b" ", 1)[0]
+                expect_header = False
+            elif line[:1] == b"\t":
+                author_lines[commit_authors.get(current_sha)] += 1
+                expect_header = True
+            elif line[:7] == b"author ":
+                commit_authors[current_sha] = line[7:].decode("utf-8", "replace").strip()
         
-        for line in blame_output.splitlines():
-            if line.startswith("author "):
-                current_author = line[7:].strip()
-                author_lines[current_author] = author_lines.get(current_author, 0) + 1
+        # Count every author's commits to the file with a single git log
+        try:
+            commit_counts = Counter(run_git_command(
+                ["git", "log", "--follow", "--format=%aN", "--", file_path.name],
+                cwd=repo_path
+            ).splitlines())
+        except Exception:
+            commit_counts = Counter()
         
         total_lines = sum(author_lines.values())
         experts = []
         
-        for author, count in sorted(author_lines.items(), key=lambda x: x[1], reverse=True):
-            # Calculate additional metrics
-            try:
-                author_commits = run_git_command(
-                    ["git", "log", "--author", author, "--pretty=format:%h", "--", file_path.name],
-                    cwd=repo_path
-                )
-                commit_count = len(author_commits.splitlines())
-            except Exception:
-                commit_count = 0
+        for author, count in author_lines.most_common():
+            commit_count = commit_counts.get(author, 0)
                 
             experts.append({
                 "author": author,
@@ -1,106 +1,205 @@
-import subprocess
+import csv
+import io
 from pathlib import Path
 import json
 import re
 from collections import defaultdict, Counter
 from datetime import datetime
 import tempfile
+import heapq
+import asyncio
 import os
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 import pandas as pd
+from functools import lru_cache, cached_property
+from concurrent.futures import Executor
 
-from who_edited.git_tools import run_git_command
+from who_edited.git_tools import (
+    run_git_command, run_git_command_stream, arun_git_command, get_head_sha, canon_author, resolve_path
+)
 
+# Heatmap timespans such as "2w" or "6m"
+_TIMESPAN_RE = re.compile(r"^(\d+)([dwmy])$")
+_TIMESPAN_UNITS = {"d": "days", "w": "weeks", "m": "months", "y": "years"}
+
+# Concurrent git processes for repository-wide blame; bounded to avoid FD exhaustion
+_MAX_CONCURRENT_GIT = 8
+
+# Author header of each `git blame --line-porcelain` record
+_BLAME_AUTHOR_RE = re.compile(rb"^author (.*)$", re.MULTILINE)
 
 def get_repo_contributors(repo_path: str) -> Dict[str, int]:
     """Get all contributors to a repository with their commit counts."""
-    output = run_git_command(
-        ["git", "shortlog", "-sne", "HEAD"],
-        cwd=repo_path
-    )
-    
-    contributors = {}
-    for line in output.splitlines():
-        parts = line.strip().split("\t")
-        if len(parts) >= 2:
-            count = int(parts[0].strip())
-            author = parts[1].strip()
-            contributors[author] = count
-            
-    return contributors
+    return dict(_contributor_counts(str(repo_path), get_head_sha(repo_path)))
+
+
+@lru_cache(maxsize=32)
+def _contributor_counts(repo_path: str, head_sha: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Count commits per author, most active first. Cached per HEAD sha; call
+    `_contributor_counts.cache_clear()` to drop stale entries.
+    """
+    output = run_git_command(["git", "log", "--pretty=format:%aN", "HEAD"], cwd=repo_path)
+    return tuple(Counter(output.splitlines()).most_common())
 
 
 def generate_contribution_timeline(repo_path: str, file_path: Optional[str] = None) -> pd.DataFrame:
     """Generate a timeline of contributions to a file or repository."""
-    cmd = ["git", "log", "--pretty=format:%h|%an|%ad|%s", "--date=short"]
+    # Fields are separated by \x1f so "|" in commit subjects survives parsing
+    cmd = ["git", "log", "--pretty=format:%h%x1f%an%x1f%ad%x1f%s", "--date=short"]
     
     if file_path:
-        file_path = Path(file_path).resolve()
         cmd.append("--")
-        cmd.append(str(file_path))
+        cmd.append(str(resolve_path(file_path)))
         
     output = run_git_command(cmd, cwd=repo_path)
+    if not output:
+        return pd.DataFrame()
+        
+    return pd.read_csv(
+        io.StringIO(output),
+        sep="\x1f",
+        header=None,
+        names=["hash", "author", "date", "message"],
+        dtype={"hash": str, "author": str, "message": str},
+        parse_dates=["date"],
+        date_format="%Y-%m-%d",  # --date=short; skips per-row format inference
+        quoting=csv.QUOTE_NONE,
+        keep_default_na=False,
+        engine="c",
+    )
+
+
+@lru_cache(maxsize=128)
+def _blame_author_counts(repo_path: str, file_path: str, head_sha: str,
+                         mtime_ns: int) -> Tuple[Tuple[str, int], ...]:
+    """
+    Blame a file and count the lines attributed to each author, streaming the
+    porcelain output instead of buffering it. Cached per HEAD sha and file mtime,
+    so a new commit or a local edit produces a fresh count; call
+    `_blame_author_counts.cache_clear()` to drop stale entries.
+    """
+    prefix = b"author "
+    counts = Counter()
+    blame_cmd = ["git", "blame", "--line-porcelain", file_path]
+    # Content lines start with a tab, so only header lines can match the prefix
+    for line in run_git_command_stream(blame_cmd, cwd=repo_path, binary=True):
+        if line.startswith(prefix):
+            counts[canon_author(line[len(prefix):])] += 1
+            
+    return tuple(counts.items())
+
+
+async def _blame_files_async(repo_path: str, files: List[str]) -> List[Tuple[Tuple[str, int], ...]]:
+    """
+    Blame files concurrently from one thread, with at most
+    `_MAX_CONCURRENT_GIT` git processes in flight.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_GIT)
+    
+    async def blame(file_path: str) -> Tuple[Tuple[str, int], ...]:
+        async with semaphore:
+            try:
+                output = await arun_git_command(["git", "blame", "--line-porcelain", file_path], cwd=repo_path)
+            except RuntimeError:
+                # Skip files git cannot blame (e.g. deleted from the working tree)
+                return ()
+        counts = Counter(_BLAME_AUTHOR_RE.findall(output))
+        return tuple((canon_author(author), lines) for author, lines in counts.items())
+        
+    return await asyncio.gather(*(blame(file_path) for file_path in files))
+
+
+@lru_cache(maxsize=32)
+def _repo_blame_line_counts(repo_path: str, head_sha: str) -> Dict[str, int]:
+    """
+    Blame every tracked file and sum the lines attributed to each author.
     
-    data = []
+    Files are blamed concurrently as asyncio subprocesses, so git runs in
+    parallel while a single thread collects the output.
+    """
+    # -z keeps paths with spaces or non-ASCII characters unquoted
+    files = [f for f in run_git_command(["git", "ls-files", "-z"], cwd=repo_path).split("\0") if f]
+    return _merge_author_counts(asyncio.run(_blame_files_async(repo_path, files)))
+
+
+def _merge_author_counts(results) -> Dict[str, int]:
+    """Sum per-file (author, lines) pairs into a single mapping."""
+    line_counts = Counter()
+    for counts in results:
+        for author, lines in counts:
+            line_counts[author] += lines
+    return dict(line_counts)
+
+
+@lru_cache(maxsize=32)
+def _history_line_counts(repo_path: str, head_sha: str) -> Dict[str, int]:
+    """
+    Approximate repository-wide line ownership from a single `git log --numstat`
+    pass: lines added minus lines deleted, summed per author.
+    """
+    # Parsed as bytes; only the distinct author names are decoded at the end
+    output = run_git_command(
+        ["git", "log", "--numstat", "--pretty=format:__%aN__"],
+        cwd=repo_path,
+        binary=True
+    )
+    
+    line_counts = defaultdict(int)
+    current_author = None
     for line in output.splitlines():
-        if "|" in line:
-            commit_hash, author, date, message = line.split("|", 3)
-            data.append({
-                "hash": commit_hash,
-                "author": author,
-                "date": datetime.strptime(date, "%Y-%m-%d"),
-                "message": message
-            })
-            
-    return pd.DataFrame(data)
+        if line.startswith(b"__") and line.endswith(b"__"):
+            current_author = line[2:-2]
+        elif line and current_author is not None:
+            added, _, rest = line.partition(b"\t")
+            deleted = rest.partition(b"\t")[0]
+            # Binary files report "-" for both counts
+            if added.isdigit() and deleted.isdigit():
+                line_counts[current_author] += int(added) - int(deleted)
+                
+    return _merge_author_counts([((canon_author(author), count) for author, count in line_counts.items())])
 
 
-def calculate_code_ownership(repo_path: str, file_path: Optional[str] = None, threshold: float = 0.05) -> Dict[str, float]:
+def calculate_code_ownership(repo_path: str, file_path: Optional[str] = None, threshold: float = 0.05,
+                             exact: bool = False) -> Dict[str, float]:
     """
     Calculate code ownership percentages.
     
+    File ownership comes from `git blame`; repository-wide ownership is
+    approximated from history as lines added minus lines deleted per author,
+    unless `exact` is set.
+    
     Args:
         repo_path: Path to the git repository
         file_path: Optional specific file path to analyze
         threshold: Minimum percentage to include in results (e.g., 0.05 = 5%)
+        exact: Blame every tracked file for repository-wide ownership
         
     Returns:
         Dictionary mapping authors to their ownership percentage
     """
-    if file_path:
-        file_path = Path(file_path).resolve()
-        cmd = ["git", "blame", "--line-porcelain", str(file_path)]
-        cwd = repo_path
-    else:
-        cmd = ["git", "ls-files", "|", "xargs", "git", "blame", "--line-porcelain"]
-        cwd = repo_path
-        
     try:
-        result = subprocess.run(
-            " ".join(cmd),
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            shell=True
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"Error running git command: {result.stderr}")
-            
-        authors = []
-        for line in result.stdout.splitlines():
-            if line.startswith("author "):
-                author = line[len("author "):].strip()
-                authors.append(author)
+        if file_path:
+            file_path = str(resolve_path(file_path))
+            ownership = dict(_blame_author_counts(
+                str(repo_path), file_path, get_head_sha(repo_path), os.stat(file_path).st_mtime_ns
+            ))
+        elif exact:
+            ownership = _repo_blame_line_counts(str(repo_path), get_head_sha(repo_path))
+        else:
+            line_counts = _history_line_counts(str(repo_path), get_head_sha(repo_path))
+            # Authors whose deletions outweigh their additions own nothing
+            ownership = {author: count for author, count in line_counts.items() if count > 0}
                 
-        total_lines = len(authors)
+        total_lines = sum(ownership.values())
         if total_lines == 0:
             return {}
             
-        ownership = Counter(authors)
         ownership_percent = {author: count/total_lines for author, count in ownership.items()}
         
         # Filter out authors below threshold
@@ -111,7 +210,8 @@ def calculate_code_ownership(repo_path: str, file_path: Optional[str] = None, th
         return {}
 
 
-def analyze_bus_factor(repo_path: str, critical_threshold: float = 0.5) -> Dict[str, Any]:
+def analyze_bus_factor(repo_path: str, critical_threshold: float = 0.5,
+                       ownership: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """
     Analyze the "bus factor" of a repository.
     
@@ -121,23 +221,28 @@ def analyze_bus_factor(repo_path: str, critical_threshold: float = 0.5) -> Dict[
     Args:
         repo_path: Path to git repository
         critical_threshold: Threshold to consider critical ownership
+        ownership: Precomputed ownership from calculate_code_ownership, if available
         
     Returns:
         Dictionary with bus factor analysis
     """
-    ownership = calculate_code_ownership(repo_path)
+    if ownership is None:
+        ownership = calculate_code_ownership(repo_path)
     if not ownership:
         return {"error": "No ownership data available"}
         
-    # Sort owners by ownership percentage (descending)
-    sorted_owners = sorted(ownership.items(), key=lambda x: x[1], reverse=True)
+    # Max-heap of owners; only the owners needed to reach 80% are ever popped
+    owners = [(-pct, author) for author, pct in ownership.items()]
+    heapq.heapify(owners)
     
     # Calculate cumulative ownership
     cumulative = 0.0
     bus_factor = 0
     critical_owners = []
     
-    for author, pct in sorted_owners:
+    while owners:
+        neg_pct, author = heapq.heappop(owners)
+        pct = -neg_pct
         cumulative += pct
         bus_factor += 1
         
@@ -169,16 +274,8 @@ def generate_file_heatmap(repo_path: str, timespan: str = "6m") -> Dict[str, int
         Dictionary mapping file paths to change frequencies
     """
     # Convert timespan to git-compatible format
-    if timespan.endswith('d'):
-        git_time = f"{timespan[:-1]} days ago"
-    elif timespan.endswith('w'):
-        git_time = f"{timespan[:-1]} weeks ago"
-    elif timespan.endswith('m'):
-        git_time = f"{timespan[:-1]} months ago"
-    elif timespan.endswith('y'):
-        git_time = f"{timespan[:-1]} years ago"
-    else:
-        git_time = "6 months ago"  # Default
+    match = _TIMESPAN_RE.match(timespan)
+    git_time = f"{match[1]} {_TIMESPAN_UNITS[match[2]]} ago" if match else "6 months ago"  # Default
         
     output = run_git_command(
         ["git", "log", f"--since={git_time}", "--name-only", "--pretty=format:"],
@@ -190,79 +287,180 @@ def generate_file_heatmap(repo_path: str, timespan: str = "6m") -> Dict[str, int
     return dict(Counter(files))
 
 
-def export_html_report(repo_path: str, output_path: str) -> str:
+class RepoSnapshot:
+    """
+    Commit history of a repository read from a single `git log` walk.
+    
+    Contributors, the contribution timeline and file change counts are all
+    derived from the same parsed output, so a report needs one history walk
+    instead of one per dataset.
+    """
+    
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        output = run_git_command(
+            ["git", "log", "--name-only", "--date=short",
+             "--pretty=format:%x00%ct%x1f%h%x1f%aN%x1f%an%x1f%ad%x1f%s"],
+            cwd=repo_path
+        )
+        
+        # (commit time, hash, mailmapped author, author, date, subject) per commit
+        self._commits: List[List[str]] = []
+        self._files: List[List[str]] = []
+        # Commit headers start with NUL, which can't appear in a file name
+        for line in output.splitlines():
+            if line.startswith("\0"):
+                fields = line[1:].split("\x1f", 5)
+                # Output stripping can eat the separator before an empty last subject
+                self._commits.append(fields + [""] * (6 - len(fields)))
+                self._files.append([])
+            elif line and self._files:
+                self._files[-1].append(line)
+                
+    @cached_property
+    def contributors(self) -> Dict[str, int]:
+        """Commit counts per author, most active first."""
+        return dict(Counter(commit[2] for commit in self._commits).most_common())
+        
+    @cached_property
+    def timeline(self) -> pd.DataFrame:
+        """Contribution timeline, as returned by `generate_contribution_timeline`."""
+        if not self._commits:
+            return pd.DataFrame()
+            
+        _, hashes, _, authors, dates, messages = zip(*self._commits)
+        return pd.DataFrame({
+            "hash": hashes,
+            "author": authors,
+            "date": pd.to_datetime(dates, format="%Y-%m-%d"),
+            "message": messages,
+        })
+        
+    def file_heatmap(self, timespan: str = "6m") -> Dict[str, int]:
+        """
+        Count changes per file, as returned by `generate_file_heatmap`.
+        
+        Args:
+            timespan: Time span to analyze (e.g., '1w', '1m', '6m', '1y')
+            
+        Returns:
+            Dictionary mapping file paths to change frequencies
+        """
+        match = _TIMESPAN_RE.match(timespan)
+        offset = pd.DateOffset(**{_TIMESPAN_UNITS[match[2]]: int(match[1])}) if match else pd.DateOffset(months=6)
+        cutoff = (pd.Timestamp.now(tz="UTC") - offset).timestamp()
+        
+        return dict(Counter(
+            file
+            for commit, files in zip(self._commits, self._files)
+            if int(commit[0]) >= cutoff
+            for file in files
+        ))
+
+
+def _save_chart(fig: Figure, directory: str, name: str) -> str:
+    """Render a figure to a PNG in `directory` and return its path."""
+    path = os.path.join(directory, name)
+    FigureCanvasAgg(fig).print_png(path)
+    return path
+
+
+def _html_table(series: pd.Series, key_label: str, value_label: str) -> str:
+    """Render a Series as a two-column HTML table, formatting fractions as percentages."""
+    frame = series.rename_axis(key_label).rename(value_label).reset_index()
+    return frame.to_html(index=False, border=0, float_format="{:.2%}".format)
+
+
+def export_html_report(repo_path: str, output_path: str, executor: Optional[Executor] = None) -> str:
     """
     Generate an HTML report with contributor analytics.
     
     Args:
         repo_path: Path to git repository
         output_path: Path to save the HTML report
+        executor: Optional executor used to run the independent git walks concurrently
         
     Returns:
         Path to the generated HTML file
     """
-    # Get repository data
-    contributors = get_repo_contributors(repo_path)
-    timeline_df = generate_contribution_timeline(repo_path)
-    ownership = calculate_code_ownership(repo_path, threshold=0.02)
-    bus_factor = analyze_bus_factor(repo_path)
-    heatmap = generate_file_heatmap(repo_path)
+    # Get repository data; contributors, timeline and heatmap share one history walk,
+    # which is independent of the ownership walk
+    if executor is not None:
+        snapshot_future = executor.submit(RepoSnapshot, repo_path)
+        ownership = calculate_code_ownership(repo_path, threshold=0.02)
+        snapshot = snapshot_future.result()
+    else:
+        snapshot = RepoSnapshot(repo_path)
+        ownership = calculate_code_ownership(repo_path, threshold=0.02)
+    contributors = snapshot.contributors
+    timeline_df = snapshot.timeline
+    # Percentages don't depend on the threshold, so filter instead of recomputing
+    bus_factor = analyze_bus_factor(
+        repo_path, ownership={author: pct for author, pct in ownership.items() if pct >= 0.05}
+    )
+    heatmap = snapshot.file_heatmap()
+    
+    # Sort each metric once; charts and tables share the same Series
+    contributors_s = pd.Series(contributors, name="commits", dtype="int64").sort_values(ascending=False)
+    ownership_s = pd.Series(ownership, name="ownership", dtype="float64").sort_values(ascending=False)
+    # Only the 20 most changed files are shown, so select them without a full sort
+    top_files = pd.Series(heatmap, name="changes", dtype="int64").nlargest(20)
+    
+    critical_owners = pd.Series(
+        {item["author"]: item["ownership"] for item in bus_factor.get("critical_owners", [])},
+        dtype="float64"
+    )
     
     # Generate visualizations
     temp_dir = tempfile.mkdtemp()
     
     # Contributors pie chart
-    plt.figure(figsize=(8, 6))
-    labels = [author for author in contributors.keys()]
-    sizes = [count for count in contributors.values()]
-    plt.pie(sizes, labels=labels, autopct='%1.1f%%')
-    plt.title('Contribution Distribution')
-    contributors_chart = os.path.join(temp_dir, "contributors.png")
-    plt.savefig(contributors_chart)
-    plt.close()
+    if not contributors_s.empty:
+        fig = Figure(figsize=(8, 6))
+        ax = fig.subplots()
+        ax.pie(contributors_s.values, labels=contributors_s.index.tolist(), autopct='%1.1f%%')
+        ax.set_title('Contribution Distribution')
+        contributors_chart = _save_chart(fig, temp_dir, "contributors.png")
+    else:
+        contributors_chart = None
     
     # Timeline chart
     if not timeline_df.empty:
-        plt.figure(figsize=(12, 6))
-        # Group by date and author, count commits
-        timeline = timeline_df.groupby([timeline_df['date'].dt.date, 'author']).size().unstack().fillna(0)
-        timeline.plot(kind='bar', stacked=True)
-        plt.title('Commit Timeline')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        timeline_chart = os.path.join(temp_dir, "timeline.png")
-        plt.savefig(timeline_chart)
-        plt.close()
+        fig = Figure(figsize=(12, 6))
+        ax = fig.subplots()
+        # Count commits per date and author
+        timeline = pd.crosstab(timeline_df['date'].dt.date, timeline_df['author'].astype('category'))
+        timeline.plot(kind='bar', stacked=True, ax=ax)
+        ax.set_title('Commit Timeline')
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
+        timeline_chart = _save_chart(fig, temp_dir, "timeline.png")
     else:
         timeline_chart = None
     
     # Ownership bar chart
-    plt.figure(figsize=(10, 6))
-    sorted_ownership = sorted(ownership.items(), key=lambda x: x[1], reverse=True)
-    authors = [item[0] for item in sorted_ownership]
-    percentages = [item[1] * 100 for item in sorted_ownership]  # Convert to percentages
-    
-    plt.barh(authors, percentages)
-    plt.xlabel('Ownership Percentage')
-    plt.title('Code Ownership Distribution')
-    plt.tight_layout()
-    ownership_chart = os.path.join(temp_dir, "ownership.png")
-    plt.savefig(ownership_chart)
-    plt.close()
+    if not ownership_s.empty:
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        ax.barh(ownership_s.index.tolist(), ownership_s.values * 100)  # Convert to percentages
+        ax.set_xlabel('Ownership Percentage')
+        ax.set_title('Code Ownership Distribution')
+        fig.tight_layout()
+        ownership_chart = _save_chart(fig, temp_dir, "ownership.png")
+    else:
+        ownership_chart = None
     
     # File heatmap (top 20 files)
-    plt.figure(figsize=(12, 8))
-    top_files = sorted(heatmap.items(), key=lambda x: x[1], reverse=True)[:20]
-    files = [os.path.basename(item[0]) for item in top_files]
-    changes = [item[1] for item in top_files]
-    
-    plt.barh(files, changes)
-    plt.xlabel('Number of Changes')
-    plt.title('Most Frequently Changed Files')
-    plt.tight_layout()
-    heatmap_chart = os.path.join(temp_dir, "heatmap.png")
-    plt.savefig(heatmap_chart)
-    plt.close()
+    if not top_files.empty:
+        fig = Figure(figsize=(12, 8))
+        ax = fig.subplots()
+        ax.barh([os.path.basename(file) for file in top_files.index], top_files.values)
+        ax.set_xlabel('Number of Changes')
+        ax.set_title('Most Frequently Changed Files')
+        fig.tight_layout()
+        heatmap_chart = _save_chart(fig, temp_dir, "heatmap.png")
+    else:
+        heatmap_chart = None
     
     # Generate HTML report
     html_content = f"""
@@ -289,32 +487,16 @@ def export_html_report(repo_path: str, output_path: str) -> str:
             
             <div class="section">
                 <h2>Contributors</h2>
-                <table>
-                    <tr>
-                        <th>Author</th>
-                        <th>Commits</th>
-                    </tr>
-                    {"".join(f"<tr><td>{author}</td><td>{count}</td></tr>" for author, count in sorted(contributors.items(), key=lambda x: x[1], reverse=True))}
-                </table>
+                {_html_table(contributors_s, "Author", "Commits")}
                 
-                <div class="chart">
-                    <img src="file://{contributors_chart}" alt="Contributors Distribution">
-                </div>
+                {f'<div class="chart"><img src="file://{contributors_chart}" alt="Contributors Distribution"></div>' if contributors_chart else ''}
             </div>
             
             <div class="section">
                 <h2>Code Ownership</h2>
-                <table>
-                    <tr>
-                        <th>Author</th>
-                        <th>Ownership Percentage</th>
-                    </tr>
-                    {"".join(f"<tr><td>{author}</td><td>{pct:.2%}</td></tr>" for author, pct in sorted(ownership.items(), key=lambda x: x[1], reverse=True))}
-                </table>
+                {_html_table(ownership_s, "Author", "Ownership Percentage")}
                 
-                <div class="chart">
-                    <img src="file://{ownership_chart}" alt="Code Ownership Distribution">
-                </div>
+                {f'<div class="chart"><img src="file://{ownership_chart}" alt="Code Ownership Distribution"></div>' if ownership_chart else ''}
             </div>
             
             <div class="section">
@@ -323,13 +505,7 @@ def export_html_report(repo_path: str, output_path: str) -> str:
                     <p><strong>Bus Factor:</strong> {bus_factor.get('bus_factor', 'N/A')}</p>
                     <p><strong>Risk Level:</strong> {bus_factor.get('risk_level', 'N/A')}</p>
                     <h3>Critical Knowledge Owners:</h3>
-                    <table>
-                        <tr>
-                            <th>Author</th>
-                            <th>Ownership Percentage</th>
-                        </tr>
-                        {"".join(f"<tr><td>{item['author']}</td><td>{item['ownership']:.2%}</td></tr>" for item in bus_factor.get('critical_owners', []))}
-                    </table>
+                    {_html_table(critical_owners, "Author", "Ownership Percentage")}
                 </div>
             </div>
             
@@ -340,17 +516,9 @@ def export_html_report(repo_path: str, output_path: str) -> str:
             
             <div class="section">
                 <h2>File Change Frequency (Top 20)</h2>
-                <table>
-                    <tr>
-                        <th>File</th>
-                        <th>Changes</th>
-                    </tr>
-                    {"".join(f"<tr><td>{file}</td><td>{count}</td></tr>" for file, count in sorted(heatmap.items(), key=lambda x: x[1], reverse=True)[:20])}
-                </table>
+                {_html_table(top_files, "File", "Changes")}
                 
-                <div class="chart">
-                    <img src="file://{heatmap_chart}" alt="File Change Frequency">
-                </div>
+                {f'<div class="chart"><img src="file://{heatmap_chart}" alt="File Change Frequency"></div>' if heatmap_chart else ''}
             </div>
         </div>
     </body>
@@ -364,41 +532,73 @@ def export_html_report(repo_path: str, output_path: str) -> str:
     return output_path
 
 
-def suggest_reviewers(repo_path: str, file_path: str, count: int = 3) -> List[str]:
+def suggest_reviewers_batch(repo_path: str, file_paths: List[str], count: int = 3) -> Dict[str, List[str]]:
     """
-    Suggest potential reviewers for a file based on ownership and contribution history.
+    Suggest potential reviewers for several files at once.
+    
+    Recent contributors for every file come from a single `git log` pass;
+    ownership is read from the per-HEAD blame cache.
     
     Args:
         repo_path: Path to git repository
-        file_path: Path to the file needing review
-        count: Number of reviewers to suggest
+        file_paths: Paths to the files needing review
+        count: Number of reviewers to suggest per file
         
     Returns:
-        List of suggested reviewers
+        Dictionary mapping each file path to its suggested reviewers
     """
-    file_path = Path(file_path).resolve()
-    
-    # Get file ownership
-    ownership = calculate_code_ownership(repo_path, file_path)
+    repo_root = resolve_path(repo_path)
+    resolved = {str(file_path): resolve_path(file_path) for file_path in file_paths}
+    relative = {path.relative_to(repo_root).as_posix(): key
+                for key, path in resolved.items() if path.is_relative_to(repo_root)}
     
-    # Get recent contributors to the file
+    # Get recent contributors to all files in one pass; --relative keeps the
+    # names relative to repo_path when it is a subdirectory of the work tree
     output = run_git_command(
-        ["git", "log", "-n", "10", "--pretty=format:%an", "--", str(file_path)],
+        ["git", "log", "-n", "200", "--name-only", "--relative", "--pretty=format:__%aN__",
+         "--", *relative],
         cwd=repo_path
-    )
+    ) if relative else ""
     
-    recent_contributors = [line for line in output.splitlines() if line.strip()]
-    
-    # Build a score for each potential reviewer
-    scores = defaultdict(float)
-    
-    # Weight ownership heavily
-    for author, pct in ownership.items():
-        scores[author] += pct * 10  # Weight ownership 10x
+    recent_contributors = defaultdict(list)
+    current_author = None
+    for line in output.splitlines():
+        if line.startswith("__") and line.endswith("__"):
+            current_author = line[2:-2]
+        elif line and current_author is not None and line in relative:
+            contributors = recent_contributors[relative[line]]
+            if len(contributors) < 10:
+                contributors.append(current_author)
+                
+    suggestions = {}
+    for key, file_path in resolved.items():
+        # Build a score for each potential reviewer
+        scores = defaultdict(float)
         
-    # Weight recent contributions
-    for author in recent_contributors:
-        scores[author] += 1
+        # Weight ownership heavily
+        for author, pct in calculate_code_ownership(repo_path, str(file_path)).items():
+            scores[author] += pct * 10  # Weight ownership 10x
+            
+        # Weight recent contributions
+        for author in recent_contributors[key]:
+            scores[author] += 1
+            
+        # Sort by score and keep the top reviewers
+        suggestions[key] = [author for author, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:count]]
         
-    # Sort by score and return top reviewers
-    return [author for author, _ in sorted(scores.items(), key=lambda x: x[1], reverse=True)[:count]] 
\ No newline at end of file
+    return suggestions
+
+
+def suggest_reviewers(repo_path: str, file_path: str, count: int = 3) -> List[str]:
+    """
+    Suggest potential reviewers for a file based on ownership and contribution history.
+    
+    Args:
+        repo_path: Path to git repository
+        file_path: Path to the file needing review
+        count: Number of reviewers to suggest
+        
+    Returns:
+        List of suggested reviewers
+    """
+    return suggest_reviewers_batch(repo_path, [file_path], count)[str(file_path)]
@@ -0,0 +1,147 @@
+"""
+On-disk caches for parsed git results and GitHub/GitLab API responses.
+
+Git entries live under ~/.cache/who_edited/git/<repo>/<HEAD sha>/ so that a new
+commit invalidates them; only the most recently used HEADs of each repository
+are kept. API responses live under ~/.cache/who_edited/http/ with their ETag or
+Last-Modified validator and are revalidated with the server on every use; only
+the most recently used responses are kept.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "who_edited" / "git"
+HTTP_CACHE_DIR = Path.home() / ".cache" / "who_edited" / "http"
+
+# HEAD snapshots kept per repository before the least recently used is evicted
+MAX_HEADS_PER_REPO = 10
+
+# API responses kept before the least recently used are evicted
+MAX_HTTP_RESPONSES = 1000
+
+
+def _head_dir(repo: str, head_sha: str) -> Path:
+    repo_key = hashlib.sha256(str(repo).encode()).hexdigest()[:16]
+    return CACHE_DIR / repo_key / head_sha
+
+
+def _entry_path(repo: str, head_sha: str, key: str) -> Path:
+    return _head_dir(repo, head_sha) / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def get(repo: str, head_sha: str, key: str) -> Optional[Any]:
+    """
+    Look up a cached value.
+
+    Args:
+        repo: Repository directory the value was computed in
+        head_sha: HEAD sha the value is valid for
+        key: Name of the cached result within that snapshot
+
+    Returns:
+        The cached value, or None if it is missing or unreadable
+    """
+    path = _entry_path(repo, head_sha, key)
+    try:
+        with open(path, "rb") as f:
+            value = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Mark this HEAD as recently used so eviction keeps it
+    try:
+        os.utime(path.parent)
+    except OSError:
+        pass
+    return value
+
+
+def put(repo: str, head_sha: str, key: str, value: Any) -> None:
+    """
+    Store a JSON-serializable value, evicting the oldest HEAD snapshots.
+
+    Args:
+        repo: Repository directory the value was computed in
+        head_sha: HEAD sha the value is valid for
+        key: Name of the cached result within that snapshot
+        value: Value to store
+    """
+    path = _entry_path(repo, head_sha, key)
+    if _write_json(path, value):
+        try:
+            _evict(path.parent.parent)
+        except OSError:
+            pass
+
+
+def get_response(key: str) -> Optional[Any]:
+    """
+    Look up a cached API response.
+
+    Args:
+        key: Identifies the request (URL, parameters and credentials)
+
+    Returns:
+        The stored response record, or None if it is missing or unreadable
+    """
+    path = _response_path(key)
+    try:
+        with open(path, "rb") as f:
+            value = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Mark the response as recently used so eviction keeps it
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return value
+
+
+def put_response(key: str, value: Any) -> None:
+    """
+    Store an API response record (body plus its validators).
+
+    Args:
+        key: Identifies the request (URL, parameters and credentials)
+        value: JSON-serializable record to store
+    """
+    if _write_json(_response_path(key), value):
+        try:
+            _evict_responses()
+        except OSError:
+            pass
+
+
+def _response_path(key: str) -> Path:
+    return HTTP_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def _write_json(path: Path, value: Any) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        # The cache is an optimization; a read-only home directory is not an error
+        return False
+
+
+def _evict_responses() -> None:
+    responses = sorted(HTTP_CACHE_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in responses[MAX_HTTP_RESPONSES:]:
+        stale.unlink(missing_ok=True)
+
+
+def _evict(repo_dir: Path) -> None:
+    heads = sorted(repo_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in heads[MAX_HEADS_PER_REPO:]:
+        shutil.rmtree(stale, ignore_errors=True)
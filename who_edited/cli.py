@@ -1,14 +1,22 @@
 # who_edited/cli.py
 import typer
 import json
-import webbrowser
+import sys
 import tempfile
 import os
+import heapq
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
 from rich.table import Table
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 from who_edited.git_tools import (
     get_blame_info,
@@ -22,34 +30,25 @@ from who_edited.git_tools import (
     get_line_content,
     get_github_url,
     get_git_blame,
-)
-
-# Import new modules
-from who_edited.tui import run_tui
-from who_edited.analytics import (
-    get_repo_contributors, 
-    calculate_code_ownership, 
-    analyze_bus_factor, 
-    generate_file_heatmap,
-    export_html_report,
-    suggest_reviewers,
-)
-from who_edited.platform_integration import (
-    get_pr_for_file_line,
-    get_review_comments_for_file,
-    open_pr_page_for_line,
-)
-from who_edited.ai_features import (
-    identify_risky_changes,
-    get_commit_frequency_patterns,
-    analyze_commit_messages,
-    suggest_reviewers_by_content,
-    get_expert_for_code_area,
+    count_lines,
+    abbreviate_hashes,
 )
 
 app = typer.Typer(help="Git blame helper CLI with advanced analytics")
 console = Console()
 
+
+def to_json(data) -> str:
+    """Serialize command output, indenting only when a person is reading it."""
+    pretty = sys.stdout.isatty()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode()
+    return json.dumps(data, indent=2 if pretty else None)
+
+
 @app.command()
 def line(
         file: str = typer.Argument(..., help="File path"),
@@ -77,10 +76,12 @@ def line(
         if web:
             url = get_github_url(file_path, line)
             typer.echo(f"Opening in browser: {url}")
+            import webbrowser
             webbrowser.open(url)
             return
             
         if pr:
+            from who_edited.platform_integration import get_pr_for_file_line
             pr_info = get_pr_for_file_line(file_path, line)
             if pr_info:
                 output["pr"] = {
@@ -96,10 +97,10 @@ def line(
                     typer.echo(f"URL: {output['pr']['url']}")
 
         if json_out:
-            typer.echo(json.dumps(output, indent=2))
+            typer.echo(to_json(output))
         else:
             typer.echo(f"Line {line} in {file_path.name} last modified by: {commit_info['author']}")
-            typer.echo(f"Commit: {commit_info['hash']}")
+            typer.echo(f"Commit: {abbreviate_hashes([commit_hash], repo_dir)[commit_hash]}")
             typer.echo(f"Date: {commit_info['date']}")
             typer.echo(f"Message: {commit_info['message']}")
             if highlight:
@@ -129,20 +130,28 @@ def summary(file: str = typer.Argument(..., help="File path to summarize")):
 def history(file: str = typer.Argument(..., help="File path"), line: int = typer.Argument(..., help="Line number")):
     """Show full git log history for a specific line."""
     try:
-        log = get_line_history(file, line)
-        typer.echo(log)
+        for log_line in get_line_history(file, line):
+            typer.echo(log_line)
     except Exception as e:
         typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
 
 
 @app.command()
-def search(file: str = typer.Argument(..., help="File path"), keyword: str = typer.Argument(..., help="Keyword to search in commits")):
+def search(
+    file: str = typer.Argument(..., help="File path"),
+    keyword: str = typer.Argument(..., help="Keyword to search in commits"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Maximum number of commits to show"),
+    content: bool = typer.Option(False, "--content", help="Match commits that add or remove the keyword in the file"),
+):
     """Search commit messages by keyword for a file."""
     try:
-        results = search_commits_by_keyword(file, keyword)
-        if results.strip():
-            typer.echo(f"Commits matching '{keyword}':\n{results}")
-        else:
+        found = False
+        for result in search_commits_by_keyword(file, keyword, limit, in_content=content):
+            if not found:
+                typer.echo(f"Commits matching '{keyword}':")
+                found = True
+            typer.echo(result)
+        if not found:
             typer.echo("No commits found matching that keyword.")
     except Exception as e:
         typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
@@ -179,6 +188,8 @@ def blame_range(file: str = typer.Argument(..., help="File path"), line_range: s
 @app.command()
 def interactive(file: str = typer.Argument(..., help="File path to view interactively")):
     """Launch an interactive TUI to explore file blame information."""
+    from who_edited.tui import run_tui
+
     try:
         run_tui(file)
     except Exception as e:
@@ -190,14 +201,17 @@ def ownership(
     repo_path: str = typer.Argument(..., help="Path to git repository"),
     file_path: Optional[str] = typer.Option(None, "--file", "-f", help="Specific file to analyze"),
     threshold: float = typer.Option(0.05, "--threshold", "-t", help="Minimum ownership percentage to show (0.0-1.0)"),
+    exact: bool = typer.Option(False, "--exact", help="Blame every tracked file instead of estimating from history"),
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Analyze code ownership for a repository or specific file."""
+    from who_edited.analytics import calculate_code_ownership
+
     try:
-        ownership_data = calculate_code_ownership(repo_path, file_path, threshold)
+        ownership_data = calculate_code_ownership(repo_path, file_path, threshold, exact=exact)
         
         if json_out:
-            typer.echo(json.dumps(ownership_data, indent=2))
+            typer.echo(to_json(ownership_data))
         else:
             target = file_path if file_path else "repository"
             table = Table(title=f"Code Ownership for {target}")
@@ -220,11 +234,13 @@ def bus_factor(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Analyze the 'bus factor' of a repository."""
+    from who_edited.analytics import analyze_bus_factor
+
     try:
         analysis = analyze_bus_factor(repo_path, threshold)
         
         if json_out:
-            typer.echo(json.dumps(analysis, indent=2))
+            typer.echo(to_json(analysis))
         else:
             console.print(f"[bold]Bus Factor:[/bold] {analysis['bus_factor']}")
             console.print(f"[bold]Risk Level:[/bold] {analysis['risk_level']}")
@@ -252,18 +268,22 @@ def heatmap(
     limit: int = typer.Option(20, "--limit", "-l", help="Number of files to show"),
 ):
     """Generate a heatmap of file changes in the repository."""
+    from who_edited.analytics import generate_file_heatmap
+
     try:
         data = generate_file_heatmap(repo_path, timespan)
+        # Only `limit` rows are shown, so select them without sorting every file
+        top_files = heapq.nlargest(limit, data.items(), key=itemgetter(1))
         
         if json_out:
-            typer.echo(json.dumps(dict(sorted(data.items(), key=lambda x: x[1], reverse=True)[:limit]), indent=2))
+            typer.echo(to_json(dict(top_files)))
         else:
             console.print(f"[bold]File Change Frequency (last {timespan}):[/bold]")
             table = Table()
             table.add_column("File", style="cyan")
             table.add_column("Changes", justify="right", style="green")
             
-            for file_path, count in sorted(data.items(), key=lambda x: x[1], reverse=True)[:limit]:
+            for file_path, count in top_files:
                 table.add_row(file_path, str(count))
                 
             console.print(table)
@@ -279,12 +299,17 @@ def report(
     open_browser: bool = typer.Option(True, "--open", help="Open the report in browser"),
 ):
     """Generate a comprehensive HTML report with visualizations."""
+    import webbrowser
+    from who_edited.analytics import export_html_report
+
     try:
         if not output_path:
             # Generate a temporary file if no output path is provided
             output_path = os.path.join(tempfile.gettempdir(), f"git_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html")
             
-        report_path = export_html_report(repo_path, output_path)
+        # Bounded pool: enough for the report's independent git walks without exhausting FDs
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            report_path = export_html_report(repo_path, output_path, executor=executor)
         console.print(f"[green]Report generated at:[/green] {report_path}")
         
         if open_browser:
@@ -302,11 +327,15 @@ def suggest_review(
     content_based: bool = typer.Option(False, "--content", help="Use content-based similarity (requires sklearn)"),
 ):
     """Suggest reviewers for a file based on history and expertise."""
+    from who_edited.analytics import suggest_reviewers
+
     try:
         file_path = Path(file_path).resolve()
         repo_path = file_path.parent
         
         if content_based:
+            # Only the content-based path needs scikit-learn
+            from who_edited.ai_features import suggest_reviewers_by_content
             try:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     file_content = f.read()
@@ -353,11 +382,13 @@ def risk(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Analyze risk factors for a file based on its change history."""
+    from who_edited.ai_features import identify_risky_changes
+
     try:
         risk_data = identify_risky_changes(file_path)
         
         if json_out:
-            typer.echo(json.dumps(risk_data, indent=2))
+            typer.echo(to_json(risk_data))
         else:
             console.print(f"[bold]Risk Analysis for {file_path}[/bold]")
             console.print(f"Risk Score: {risk_data['risk_score']}")
@@ -392,22 +423,21 @@ def expert(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Find code experts for a file or section of code."""
+    from who_edited.ai_features import get_expert_for_code_area
+
     try:
         file_path = Path(file_path).resolve()
         repo_path = file_path.parent
         
         # If no line range is specified, use the whole file
         if line_start is None or line_end is None:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                line_count = sum(1 for _ in f)
-                
             line_start = 1
-            line_end = line_count
+            line_end = count_lines(file_path)
             
         experts = get_expert_for_code_area(repo_path, file_path, line_start, line_end)
         
         if json_out:
-            typer.echo(json.dumps(experts, indent=2))
+            typer.echo(to_json(experts))
         else:
             console.print(f"[bold]Code Experts for {file_path.name} (lines {line_start}-{line_end}):[/bold]")
             
@@ -439,11 +469,13 @@ def review_comments(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Get code review comments for a file from GitHub/GitLab."""
+    from who_edited.platform_integration import get_review_comments_for_file
+
     try:
         comments = get_review_comments_for_file(file_path)
         
         if json_out:
-            typer.echo(json.dumps(comments, indent=2))
+            typer.echo(to_json(comments))
         else:
             if not comments:
                 console.print("[yellow]No review comments found for this file[/yellow]")
@@ -471,11 +503,13 @@ def commit_patterns(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Analyze commit frequency patterns for authors."""
+    from who_edited.ai_features import get_commit_frequency_patterns
+
     try:
         patterns = get_commit_frequency_patterns(repo_path, author, days)
         
         if json_out:
-            typer.echo(json.dumps(patterns, indent=2))
+            typer.echo(to_json(patterns))
         else:
             title = f"Commit Patterns for {'all authors' if author is None else author}"
             console.print(f"[bold]{title} (last {days} days)[/bold]")
@@ -512,11 +546,13 @@ def message_analysis(
     json_out: bool = typer.Option(False, "--json", help="Output in JSON format"),
 ):
     """Analyze commit message patterns for authors."""
+    from who_edited.ai_features import analyze_commit_messages
+
     try:
         analysis = analyze_commit_messages(repo_path, author, count)
         
         if json_out:
-            typer.echo(json.dumps(analysis, indent=2))
+            typer.echo(to_json(analysis))
         else:
             title = f"Commit Message Analysis for {'all authors' if author is None else author}"
             console.print(f"[bold]{title} (last {count} commits)[/bold]")
@@ -533,8 +569,8 @@ def message_analysis(
                     console.print(f"  {pattern}: {count} ({percentage:.1f}%)")
                     
             console.print("\n[bold]Common Words:[/bold]")
-            words = analysis['common_words']
-            for word, count in sorted(words.items(), key=lambda x: x[1], reverse=True)[:10]:
+            # Already the ten most common words, in descending order
+            for word, count in analysis['common_words'].items():
                 console.print(f"  {word}: {count}")
                 
     except Exception as e:
@@ -1,105 +1,607 @@
 import subprocess
+import tempfile
+import asyncio
+import sys
 from pathlib import Path
 import json
-
-def run_git_command(cmd_list, cwd):
-    result = subprocess.run(cmd_list, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+import atexit
+import threading
+import os
+import re
+from itertools import islice
+from functools import lru_cache
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from who_edited import cache
+
+# Files larger than this are blamed one line at a time instead of whole
+_FULL_BLAME_MAX_BYTES = 8 * 1024 * 1024
+
+
+def resolve_path(file_path):
+    """Return `file_path` as an absolute Path with symlinks resolved."""
+    # Only absolute paths are cached: a relative one means something else after
+    # a chdir
+    return _resolve_absolute(os.path.abspath(file_path))
+
+
+@lru_cache(maxsize=256)
+def _resolve_absolute(file_path):
+    # Resolving walks every path component; helpers see the same few paths
+    # many times per command
+    return Path(file_path).resolve()
+
+
+def run_git_command(cmd_list, cwd, binary=False):
+    # Output is always read as bytes: decoding once with bytes.decode is a single
+    # C pass, where text=True adds a TextIOWrapper and newline translation and
+    # fails outright on non-UTF-8 author names or file paths. binary=True returns
+    # the raw, unstripped bytes so large outputs can be split first and only the
+    # needed fields decoded.
+    result = subprocess.run(cmd_list, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     if result.returncode != 0:
-        raise RuntimeError(result.stderr)
-    return result.stdout.strip()
+        raise RuntimeError(result.stderr.decode("utf-8", "replace"))
+    return result.stdout if binary else result.stdout.decode("utf-8", "replace").strip()
+
+
+async def arun_git_command(cmd_list, cwd):
+    """Run a git command without blocking the event loop, returning raw stdout bytes."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd_list, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8", "replace"))
+    return stdout
+
+
+def run_git_command_stream(cmd_list, cwd, binary=False):
+    """Yield git output line by line while the command is still running."""
+    # Read as bytes and split on "\n" only, like run_git_command: text mode's
+    # universal newlines would also split on a "\r" inside file content or a
+    # commit message. binary=True yields the raw bytes of each line.
+    # stderr goes to a temporary file rather than a pipe: a pipe nobody reads
+    # until stdout ends would block git once its warnings fill the buffer
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(cmd_list, cwd=cwd, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            for line in iter(proc.stdout.readline, b""):
+                line = line.rstrip(b"\n")
+                yield line if binary else line.decode("utf-8", "replace")
+            if proc.wait() != 0:
+                stderr_file.seek(0)
+                raise RuntimeError(stderr_file.read().decode("utf-8", "replace"))
+        finally:
+            # Stop git early if the caller abandoned the stream
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+
+@lru_cache(maxsize=4096)
+def canon_author(raw_name):
+    """
+    Decode and trim a raw author name from git output, interned so every
+    author-keyed dict shares one string per author. Memoized: blame and log
+    output repeat the same few names on thousands of lines.
+    """
+    return sys.intern(raw_name.strip().decode("utf-8", "replace"))
+
+
+# One `git blame --line-porcelain` record; headers not needed here are skipped
+_BLAME_RECORD_RE = re.compile(
+    rb"^([0-9a-f]{40,64}) \d+ (\d+)(?: \d+)?\n"
+    rb"author ([^\n]*)\n"
+    rb"(?:author-mail [^\n]*\n)?"
+    rb"author-time (\d+)\n"
+    rb"author-tz ([^\n]*)\n"
+    rb"(?:(?!summary )[^\t\n][^\n]*\n)*"
+    rb"summary ([^\n]*)\n"
+    rb"((?:(?!filename )[^\t\n][^\n]*\n)*)"
+    rb"filename ([^\n]*)\n"
+    rb"\t([^\n]*)",
+    re.MULTILINE
+)
+
+
+@lru_cache(maxsize=64)
+def _full_blame_porcelain(repo_dir, file_name, head_sha, mtime_ns):
+    # head_sha and mtime_ns only key the cache: a new commit or a local edit
+    # must produce a fresh blame
+    cache_key = f"blame:{file_name}:{mtime_ns}"
+    cached = cache.get(repo_dir, head_sha, cache_key)
+    if cached is not None:
+        return tuple(cached)
+
+    output = run_git_command(["git", "blame", "--line-porcelain", file_name], cwd=repo_dir, binary=True)
+
+    blame = []
+    for match in _BLAME_RECORD_RE.finditer(output):
+        (sha, line, author, author_time, author_tz,
+         summary, extra, filename, content) = match.groups()
+        blame.append({
+            "hash": sha.decode(),
+            "line": int(line),
+            "boundary": extra.startswith(b"boundary\n") or b"\nboundary\n" in extra,
+            "author": canon_author(author),
+            "author_time": author_time.decode(),
+            "author_tz": author_tz.decode(),
+            "summary": summary.decode("utf-8", "replace"),
+            "filename": filename.decode("utf-8", "replace"),
+            "content": content.decode("utf-8", "replace"),
+        })
+    cache.put(repo_dir, head_sha, cache_key, blame)
+    return tuple(blame)
+
+
+def get_full_blame(file_path):
+    """
+    Blame every line of a file once, returning one dict per line.
+
+    Results are cached per (file, HEAD sha, file mtime), so repeated lookups
+    on an unchanged file reuse a single `git blame --line-porcelain` run.
+    """
+    file_path = resolve_path(file_path)
+    repo_dir = file_path.parent
+    head_sha = get_head_sha(repo_dir)
+    return _full_blame_porcelain(str(repo_dir), file_path.name, head_sha, os.stat(file_path).st_mtime_ns)
+
+
+_NULL_SHA_RE = re.compile(r"^0+$")
+
+# (repo dir, full sha) -> git's unique abbreviation; abbreviations only grow as a
+# repository does, so an entry stays valid for the life of the process
+_abbrev_cache = {}
+
+
+def abbreviate_hashes(hashes, repo_dir):
+    """
+    Map full commit shas to git's shortest unique abbreviation (as in `%h`).
+
+    Only for display: lookups must keep using the full sha, since a short
+    prefix can become ambiguous as the repository grows.
+    """
+    key = str(repo_dir)
+    # Uncommitted lines blame to the all-zero sha, which names no object
+    missing = [h for h in dict.fromkeys(hashes) if (key, h) not in _abbrev_cache and not _NULL_SHA_RE.match(h)]
+    if missing:
+        output = run_git_command(["git", "log", "--no-walk=unsorted", "--format=%H %h", *missing], cwd=repo_dir)
+        for line in output.splitlines():
+            full, short = line.split()
+            _abbrev_cache[(key, full)] = short
+    return {h: _abbrev_cache.get((key, h), h[:7]) for h in hashes}
+
+
+def blame_entry_date(entry):
+    """Return a blame entry's author date in the author's own timezone."""
+    tz = entry["author_tz"]
+    sign = -1 if tz.startswith("-") else 1
+    offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5])) * sign
+    return datetime.fromtimestamp(int(entry["author_time"]), timezone(offset))
+
+
+def format_blame_lines(entries, repo_dir):
+    """Render blame entries in `git blame`'s default human-readable layout."""
+    entries = list(entries)
+    if not entries:
+        return ""
+    # Like git blame: every hash gets the longest unique abbreviation plus one
+    # character, which boundary commits spend on a "^" prefix
+    abbrev = max(map(len, abbreviate_hashes([entry["hash"] for entry in entries], repo_dir).values()))
+    author_width = max(len(entry["author"]) for entry in entries)
+    line_width = len(str(max(entry["line"] for entry in entries)))
+    file_names = {entry["filename"] for entry in entries}
+    show_name = len(file_names) > 1
+    name_width = max(map(len, file_names))
+
+    lines = []
+    for entry in entries:
+        commit = "^" + entry["hash"][:abbrev] if entry["boundary"] else entry["hash"][:abbrev + 1]
+        if show_name:
+            commit = f"{commit} {entry['filename']:<{name_width}}"
+        date = blame_entry_date(entry)
+        lines.append(
+            f"{commit} ({entry['author']:<{author_width}} {date:%Y-%m-%d %H:%M:%S} {entry['author_tz']} "
+            f"{entry['line']:>{line_width}}) {entry['content']}"
+        )
+    return "\n".join(lines)
 
 
 def get_blame_info(file_path: str, line_number: int):
-    file_path = Path(file_path).resolve()
+    file_path = resolve_path(file_path)
     repo_dir = file_path.parent
 
-    blame_output = run_git_command(
-        ["git", "blame", f"-L{line_number},{line_number}", file_path.name],
-        cwd=repo_dir
-    )
-    commit_hash = blame_output.split()[0]
-    return commit_hash, file_path, repo_dir
+    if file_path.stat().st_size > _FULL_BLAME_MAX_BYTES:
+        # Blaming all of a very large file costs far more than the one line needed;
+        # porcelain output starts with the full sha
+        blame_output = run_git_command(
+            ["git", "blame", "--porcelain", f"-L{line_number},{line_number}", file_path.name],
+            cwd=repo_dir
+        )
+        return blame_output.split()[0], file_path, repo_dir
+
+    blame = get_full_blame(file_path)
+    if not 1 <= line_number <= len(blame):
+        raise RuntimeError(f"fatal: file {file_path.name} has only {len(blame)} lines")
+    return blame[line_number - 1]["hash"], file_path, repo_dir
+
+
+class GitBackend:
+    """A long-lived `git cat-file --batch` process for reading objects from one repository."""
+
+    def __init__(self, repo_dir):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=repo_dir,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        self._lock = threading.Lock()
+
+    def is_alive(self):
+        return self.proc.poll() is None
+
+    def read_object(self, rev):
+        """Return the (type, raw content) of the object `rev` names."""
+        with self._lock:
+            try:
+                self.proc.stdin.write(f"{rev}\n".encode())
+                self.proc.stdin.flush()
+            except BrokenPipeError:
+                raise RuntimeError(f"git cat-file exited while reading {rev}")
+            header = self.proc.stdout.readline().split()
+            # Unknown revisions answer "<rev> missing" (or "ambiguous") with no body
+            if len(header) != 3:
+                raise RuntimeError(f"fatal: bad object {rev}")
+            _, obj_type, size = header
+            content = self.proc.stdout.read(int(size))
+            self.proc.stdout.read(1)  # Trailing newline after the object body
+        return obj_type.decode(), content
+
+    def rev_parse(self, rev):
+        """Return the full sha `rev` names, without spawning `git rev-parse`."""
+        with self._lock:
+            try:
+                self.proc.stdin.write(f"{rev}\n".encode())
+                self.proc.stdin.flush()
+            except BrokenPipeError:
+                raise RuntimeError(f"git cat-file exited while reading {rev}")
+            header = self.proc.stdout.readline().split()
+            if len(header) != 3:
+                raise RuntimeError(f"fatal: bad revision {rev}")
+            sha, _, size = header
+            self.proc.stdout.read(int(size) + 1)
+        return sha.decode()
+
+    def close(self):
+        if self.is_alive():
+            self.proc.stdin.close()
+            self.proc.wait()
+
+
+_backends = {}
+
+
+def get_backend(repo_dir):
+    """Return the cached GitBackend for `repo_dir`, starting one if needed."""
+    key = str(repo_dir)
+    backend = _backends.get(key)
+    if backend is None or not backend.is_alive():
+        backend = _backends[key] = GitBackend(repo_dir)
+    return backend
+
+
+@atexit.register
+def _close_backends():
+    for backend in _backends.values():
+        backend.close()
+    _backends.clear()
+
+
+def _format_git_date(timestamp, tz_offset):
+    # Matches git's default --date format, e.g. "Thu Oct 15 04:54:17 2026 +0000"
+    sign = -1 if tz_offset.startswith("-") else 1
+    offset = timedelta(hours=int(tz_offset[1:3]), minutes=int(tz_offset[3:5])) * sign
+    date = datetime.fromtimestamp(int(timestamp), timezone(offset))
+    return f"{date:%a %b} {date.day} {date:%H:%M:%S %Y} {tz_offset}"
+
+
+@lru_cache(maxsize=64)
+def _find_git_dirs(repo_dir):
+    """Locate the (work tree root, git dir, common dir) for `repo_dir` by walking up to `.git`."""
+    for directory in (Path(repo_dir), *Path(repo_dir).parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+        elif dot_git.is_file():
+            # Linked worktrees and submodules point at their git dir
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = (directory / content[len("gitdir: "):]).resolve()
+        else:
+            continue
+        commondir = git_dir / "commondir"
+        common_dir = (git_dir / commondir.read_text().strip()).resolve() if commondir.is_file() else git_dir
+        return directory, git_dir, common_dir
+    return None
+
+
+def _read_head_sha(repo_dir):
+    git_dirs = _find_git_dirs(str(repo_dir))
+    if git_dirs is None:
+        return None
+    _, git_dir, common_dir = git_dirs
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD
+    ref = head[len("ref: "):]
+    for base in (git_dir, common_dir):
+        ref_path = base / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip()
+    packed_refs = common_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+            if name == ref:
+                return sha
+    return None
+
+
+def get_head_sha(repo_dir):
+    """
+    Return the sha HEAD points at.
+
+    Reads `.git/HEAD` and the ref it names directly, which costs a couple of
+    file reads instead of a git process; unusual layouts (reftable, unborn
+    branches, ...) fall back to asking git.
+    """
+    try:
+        head_sha = _read_head_sha(repo_dir)
+    except (OSError, UnicodeDecodeError):
+        head_sha = None
+    return head_sha or get_backend(repo_dir).rev_parse("HEAD")
 
 
 def get_commit_info(commit_hash: str, cwd):
-    output = run_git_command(
-        ["git", "show", "-s", "--format=%an|%ad|%s", commit_hash],
-        cwd=cwd
-    )
-    author, date, msg = output.split("|")
+    head_sha = get_head_sha(cwd)
+    cache_key = f"commit:{commit_hash}"
+    commit_info = cache.get(str(cwd), head_sha, cache_key)
+    if commit_info is None:
+        commit_info = _read_commit_info(commit_hash, cwd)
+        cache.put(str(cwd), head_sha, cache_key, commit_info)
+    return commit_info
+
+
+def _read_commit_info(commit_hash, cwd):
+    obj_type, content = get_backend(cwd).read_object(commit_hash)
+    if obj_type != "commit":
+        raise RuntimeError(f"fatal: {commit_hash} is a {obj_type}, not a commit")
+    return _parse_commit(commit_hash, content)
+
+
+def _parse_commit(commit_hash, content):
+    headers, _, message = content.decode("utf-8", "replace").partition("\n\n")
+    author_line = next(line for line in headers.splitlines() if line.startswith("author "))
+    ident, timestamp, tz_offset = author_line[len("author "):].rsplit(" ", 2)
+    author = ident[:ident.rfind("<")].strip()
+
+    # %s: the first paragraph of the message, its lines (minus trailing
+    # whitespace) joined with single spaces; other whitespace is kept as-is
+    subject_lines = []
+    for line in message.split("\n"):
+        line = line.rstrip()
+        if line:
+            subject_lines.append(line)
+        elif subject_lines:
+            break
+    subject = " ".join(subject_lines)
     return {
         "author": author,
-        "date": date,
-        "message": msg,
+        "date": _format_git_date(timestamp, tz_offset),
+        "message": subject,
         "hash": commit_hash
     }
 
 
+def batch_commit_info(hashes, repo_dir):
+    """
+    Look up many commits with a single `git cat-file --batch` run.
+
+    Returns a dict mapping each requested hash to the same dict get_commit_info
+    returns; hashes that do not name a commit are left out.
+    """
+    head_sha = get_head_sha(repo_dir)
+    commits = {}
+    missing = []
+    for commit_hash in dict.fromkeys(hashes):
+        commit_info = cache.get(str(repo_dir), head_sha, f"commit:{commit_hash}")
+        if commit_info is None:
+            missing.append(commit_hash)
+        else:
+            commits[commit_hash] = commit_info
+    if not missing:
+        return commits
+
+    # All requests go in at once; a one-shot process avoids interleaving them
+    # with the shared GitBackend's request/response protocol
+    request = "".join(f"{commit_hash}\n" for commit_hash in missing).encode()
+    output = subprocess.run(
+        ["git", "cat-file", "--batch"], cwd=repo_dir, input=request,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ).stdout
+
+    pos = 0
+    for commit_hash in missing:
+        eol = output.find(b"\n", pos)
+        if eol == -1:
+            break
+        header = output[pos:eol].split()
+        pos = eol + 1
+        # "<rev> missing" / "<rev> ambiguous" answers carry no body
+        if len(header) != 3:
+            continue
+        _, obj_type, size = header
+        content = output[pos:pos + int(size)]
+        pos += int(size) + 1
+        if obj_type == b"commit":
+            commit_info = commits[commit_hash] = _parse_commit(commit_hash, content)
+            cache.put(str(repo_dir), head_sha, f"commit:{commit_hash}", commit_info)
+    return commits
+
+
 def get_commit_diff(commit_hash, cwd):
     return run_git_command(["git", "show", commit_hash], cwd)
 
 
 def get_blame_summary(file_path: str):
-    file_path = Path(file_path).resolve()
-    repo_dir = file_path.parent
-    blame_output = run_git_command(["git", "blame", file_path.name], cwd=repo_dir)
-    authors = {}
-    for line in blame_output.splitlines():
-        author = line.split('(')[1].split('  ')[0].strip()
-        authors[author] = authors.get(author, 0) + 1
-    return sorted(authors.items(), key=lambda x: -x[1])
+    return Counter(entry["author"] for entry in get_full_blame(file_path)).most_common()
+
+
+_commit_graph_repos = set()
+
+
+def _ensure_commit_graph(repo_dir):
+    """
+    Write a commit-graph once per repository so history walks can skip parsing commits.
+
+    Opt-in (WHO_EDITED_COMMIT_GRAPH=1): it writes into the repository's .git and the
+    first write on a large repository takes longer than the walk it speeds up.
+    """
+    if os.environ.get("WHO_EDITED_COMMIT_GRAPH") != "1":
+        return
+    key = str(repo_dir)
+    if key in _commit_graph_repos:
+        return
+    _commit_graph_repos.add(key)
+    try:
+        git_dirs = _find_git_dirs(key)
+        if git_dirs is None:
+            return
+        info_dir = git_dirs[2] / "objects" / "info"
+        if (info_dir / "commit-graph").exists() or (info_dir / "commit-graphs").exists():
+            return
+        if not os.access(info_dir if info_dir.exists() else info_dir.parent, os.W_OK):
+            return
+        # Respect repositories that have turned commit-graphs off
+        enabled = subprocess.run(
+            ["git", "config", "--type=bool", "core.commitGraph"], cwd=repo_dir,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        ).stdout.strip()
+        if enabled == b"false":
+            return
+        run_git_command(
+            ["git", "commit-graph", "write", "--reachable", "--changed-paths", "--no-progress"],
+            cwd=repo_dir
+        )
+    except (RuntimeError, OSError):
+        # Not fatal: history walks still work without the graph
+        pass
 
 
 def get_line_history(file_path, line_number):
-    file_path = Path(file_path).resolve()
+    file_path = resolve_path(file_path)
     repo_dir = file_path.parent
-    return run_git_command(["git", "log", f"-L{line_number},{line_number}:{file_path.name}"], cwd=repo_dir)
+    _ensure_commit_graph(repo_dir)
+    # Yield lines as git produces them so long histories print immediately
+    yield from run_git_command_stream(["git", "log", f"-L{line_number},{line_number}:{file_path.name}"], cwd=repo_dir)
 
 
-def search_commits_by_keyword(file_path, keyword):
-    file_path = Path(file_path).resolve()
+def search_commits_by_keyword(file_path, keyword, limit=None, in_content=False):
+    file_path = resolve_path(file_path)
     repo_dir = file_path.parent
-    return run_git_command(["git", "log", "--pretty=format:%h %an %s", "--grep", keyword], cwd=repo_dir)
+    _ensure_commit_graph(repo_dir)
+    # -S matches commits that add or remove the keyword in the file's content;
+    # --grep matches commit messages
+    match = [f"-S{keyword}"] if in_content else ["--grep", keyword]
+    # The pathspec limits the walk to commits touching this file
+    cmd = ["git", "log", "--pretty=format:%h %an %s", *match]
+    if limit is not None:
+        # git stops walking history once it has printed `limit` matches
+        cmd += ["-n", str(limit)]
+    cmd += ["--", file_path.name]
+    yield from run_git_command_stream(cmd, cwd=repo_dir)
 
 
 def get_recent_modified_files(repo_path):
+    _ensure_commit_graph(repo_path)
     return run_git_command(["git", "log", "-n", "10", "--name-only", "--pretty=format:"], cwd=repo_path)
 
 
+def get_blame_entries(file_path, line_range: str):
+    """Return the parsed blame entries for a "start-end" line range."""
+    start, end = sorted(int(n) for n in line_range.split("-"))
+    blame = get_full_blame(file_path)
+    if start < 1:
+        raise RuntimeError(f"fatal: -L invalid line number: {start}")
+    if start > len(blame):
+        raise RuntimeError(f"fatal: file {Path(file_path).name} has only {len(blame)} lines")
+    return blame[start - 1:end]
+
+
 def get_blame_range(file_path, line_range: str):
-    file_path = Path(file_path).resolve()
-    repo_dir = file_path.parent
-    start, end = line_range.split("-")
-    return run_git_command(["git", "blame", f"-L{start},{end}", file_path.name], cwd=repo_dir)
+    return format_blame_lines(get_blame_entries(file_path, line_range), resolve_path(file_path).parent)
 
 
 def get_line_content(file_path, line_number):
+    if line_number < 1:
+        return "Line not found."
+    # Stop reading at the target line instead of loading the whole file
     with open(file_path, "r") as f:
-        lines = f.readlines()
-    if 0 <= line_number - 1 < len(lines):
-        return lines[line_number - 1].strip()
+        line = next(islice(f, line_number - 1, line_number), None)
+    if line is not None:
+        return line.strip()
     return "Line not found."
 
 
-#def get_github_url(file_path, line_number):
-    # This assumes GitHub and https remote — can be expanded for GitLab
-#    file_path = Path(file_path).resolve()
- #   repo_dir = file_path.parent
-#    remote = run_git_command(["git", "config", "--get", "remote.origin.url"], cwd=repo_dir)
-#
-#    if remote.endswith(".git"):
-#        remote = remote[:-4]
-#    if remote.startswith("git@"):
-#        remote = remote.replace("git@", "https://").replace(":", "/")
-#
-#    branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
-#    relative_path = file_path.relative_to(repo_dir.parent)
-
-#    return f"{remote}/blame/{branch}/{relative_path}#L{line_number}"
+def count_lines(file_path):
+    """Count the lines in a file, including a final line with no trailing newline."""
+    count = 0
+    last = b"\n"
+    # bytes.count scans each block in C; fixed-size blocks keep memory flat
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+@lru_cache(maxsize=32)
+def get_remote_url(repo_dir):
+    """Return the URL of the `origin` remote of the repository containing `repo_dir`."""
+    # The remote doesn't change within a process
+    return run_git_command(["git", "config", "--get", "remote.origin.url"], cwd=repo_dir)
+
+
+def get_branch_and_toplevel(repo_dir):
+    """
+    Return the checked-out branch and the work tree root for `repo_dir`.
+
+    A detached HEAD reports its branch as "HEAD".
+    """
+    # Read from .git directly; fall back to git for layouts the walk can't handle
+    try:
+        git_dirs = _find_git_dirs(repo_dir)
+        if git_dirs is not None:
+            toplevel, git_dir, _ = git_dirs
+            head = (git_dir / "HEAD").read_text().strip()
+            # Detached HEAD reports as "HEAD", like `git rev-parse --abbrev-ref HEAD`
+            branch = head.removeprefix("ref: refs/heads/") if head.startswith("ref: refs/heads/") else "HEAD"
+            return branch, str(toplevel)
+    except (OSError, UnicodeDecodeError):
+        pass
+    repo_root, branch = run_git_command(
+        ["git", "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"], cwd=repo_dir
+    ).splitlines()
+    return branch, repo_root
+
+
 def get_github_url(file_path, line_number):
-    file_path = Path(file_path).resolve()
+    file_path = resolve_path(file_path)
     repo_dir = file_path.parent
-    remote = run_git_command(["git", "config", "--get", "remote.origin.url"], cwd=repo_dir)
+    remote = get_remote_url(str(repo_dir))
+    branch, repo_root = get_branch_and_toplevel(str(repo_dir))
 
     # Handle SSH URLs (git@bitbucket.org:user/repo.git)
     if remote.startswith("git@"):
@@ -107,18 +609,10 @@ def get_github_url(file_path, line_number):
         domain, path = remote.split(":", 1)
         remote = f"https://{domain}/{path}"
     
-    # Handle HTTPS URLs
-    elif remote.startswith("http"):
-        remote = remote.replace(".git", "")
-
-    # Ensure .git is stripped
-    remote = remote.rstrip(".git")
-
-    # Get current branch
-    branch = run_git_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
+    # Ensure .git is stripped; rstrip(".git") would also eat trailing "g", "i" or "t"
+    remote = remote.removesuffix(".git")
 
     # Determine relative file path from repo root
-    repo_root = run_git_command(["git", "rev-parse", "--show-toplevel"], cwd=repo_dir)
     relative_path = file_path.relative_to(repo_root)
 
     # Construct final URL
@@ -129,32 +623,8 @@ def get_github_url(file_path, line_number):
 
 
 def get_git_blame(file_path, line_number):
-    file_path = Path(file_path).resolve()
-    repo_root = file_path.parent
-
     try:
-        result = subprocess.run(
-            ["git", "blame", f"-L{line_number},{line_number}", str(file_path.name)],
-            cwd=repo_root,  # Run git in the file’s directory
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True
-        )
-        line = result.stdout.strip()
-        commit_hash = line.split()[0]
+        commit_hash, _, repo_root = get_blame_info(file_path, line_number)
         return commit_hash, repo_root
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Error running git blame: {e.stderr}")
-
-
-def get_commit_info(commit_hash, repo_root):
-    result = subprocess.run(
-        ["git", "show", "-s", "--format=%an|%ad|%s", commit_hash],
-        cwd=repo_root,
-        stdout=subprocess.PIPE,
-        text=True
-    )
-    author, date, msg = result.stdout.strip().split("|")
-    return {"author": author, "date": date, "message": msg, "hash": commit_hash}
-
+    except RuntimeError as e:
+        raise RuntimeError(f"Error running git blame: {e}")
@@ -1,69 +1,386 @@
 import requests
 import json
 import os
+import re
+import threading
+import time
 import urllib.parse
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 from pathlib import Path
 from datetime import datetime
 import webbrowser
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from who_edited.git_tools import run_git_command
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
 
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+except ImportError:  # Optional; fall back to requests over HTTP/1.1
+    httpx = None
 
-class GitHubAPI:
+from who_edited import cache
+from who_edited.git_tools import run_git_command, get_blame_info, get_remote_url, get_branch_and_toplevel
+
+# SSH (git@host:owner/repo.git, ssh://git@host/owner/repo) and HTTP(S) remotes;
+# GitLab subgroups stay in "repo"
+_REMOTE_URL_RE = re.compile(
+    r"^(?:(?:ssh|https?)://)?(?:[^@/]+@)?(?P<host>[^:/]+)(?::\d+)?[:/]"
+    r"(?P<owner>[^/]+)/(?P<repo>.+?)(?:\.git)?/?$"
+)
+
+# Decodes raw response bytes; PR and comment listings can be hundreds of KB
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Transport failures that mean "try another way", whichever HTTP client is in use
+_HTTP_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# Per-PR requests in flight at once; stays under the session's connection pool
+# size and well clear of the platforms' secondary rate limits
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Most recent commits of a file whose PRs/MRs are looked up; older history
+# rarely carries review comments on the current lines
+_MAX_COMMIT_LOOKUPS = 100
+
+# Commits or pull requests looked up per aliased GraphQL query; 100 PRs x 50
+# threads x 50 comments stays inside GitHub's 500,000-node limit per query
+_GRAPHQL_BATCH_SIZE = 100
+
+# A pull request's first 50 review threads and 50 comments per thread; the
+# pageInfo flags PRs with more, whose comments are then fetched over REST
+_PR_REVIEW_FRAGMENT = """
+fragment prReviewComments on PullRequest {
+  number
+  title
+  reviewThreads(first: 50) {
+    pageInfo { hasNextPage }
+    nodes {
+      comments(first: 50) {
+        pageInfo { hasNextPage }
+        nodes { body author { login } line originalLine createdAt url path }
+      }
+    }
+  }
+}
+"""
+
+# Requests per hour GitHub allows an authenticated token
+_DEFAULT_RATE_LIMIT = 5000
+
+
+class TokenPool:
+    """
+    Share requests across several GitHub tokens, always using the one with the
+    most rate-limit budget left and waiting for a reset once all are spent.
+    """
+
+    def __init__(self, tokens: List[str]):
+        # Budgets are unknown until a response reports them; assume GitHub's hourly
+        # allowance (finite, so handing a token out lowers it and the next caller
+        # gets a different one)
+        self._remaining = {token: _DEFAULT_RATE_LIMIT for token in tokens}
+        self._reset = {token: 0.0 for token in tokens}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """Return the token with the most requests left, sleeping if none have any."""
+        while True:
+            with self._lock:
+                now = time.time()
+                for token, reset in self._reset.items():
+                    if self._remaining[token] <= 0 and reset <= now:
+                        self._remaining[token] = _DEFAULT_RATE_LIMIT
+                token = max(self._remaining, key=self._remaining.get)
+                if self._remaining[token] > 0:
+                    # Count the request now so concurrent callers spread across tokens
+                    self._remaining[token] -= 1
+                    return token
+                wait = min(self._reset.values()) - now
+            time.sleep(max(wait, 1))
+
+    def update(self, token: str, headers: Dict[str, str]) -> None:
+        """Record the budget a response reported for `token`."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self._remaining[token] = int(remaining)
+            self._reset[token] = float(reset)
+
+
+class _APIClient:
+    """Base for the platform clients: one pooled, retrying HTTP session per client."""
+
+    token_pool: Optional[TokenPool] = None
+
+    def _start_session(self):
+        """Create the keep-alive session that carries `self.headers` on every request."""
+        if httpx is not None:
+            # HTTP/2 multiplexes the concurrent per-PR requests over one connection
+            self.session = httpx.Client(
+                http2=True,
+                headers=self.headers,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    http2=True, retries=3,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+                ),
+            )
+            return
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Any:
+        """Send a request, authenticating with the pool's best token when there is a pool."""
+        headers = dict(headers or {})
+        token = None
+        if self.token_pool is not None:
+            token = self.token_pool.acquire()
+            headers["Authorization"] = f"token {token}"
+        response = self.session.request(method, url, headers=headers, **kwargs)
+        if token is not None:
+            self.token_pool.update(token, response.headers)
+        return response
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None, not_found_ok: bool = False) -> Any:
+        """GET a JSON resource; see `_get_page`."""
+        return self._get_page(url, params, not_found_ok)[0]
+
+    def _get_all(self, url: str, params: Optional[Dict[str, Any]] = None,
+                 max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        GET every page of a list endpoint, 100 items at a time.
+
+        Args:
+            url: Resource URL
+            params: Query parameters for the first page
+            max_pages: Stop after this many pages (None for all)
+
+        Returns:
+            The items of all pages, in order
+        """
+        items = []
+        params = {**(params or {}), "per_page": 100}
+        pages = 0
+        while url and (max_pages is None or pages < max_pages):
+            body, url = self._get_page(url, params)
+            # The "next" link already carries the query string
+            params = None
+            items.extend(body)
+            pages += 1
+        return items
+
+    def _get_page(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  not_found_ok: bool = False) -> Tuple[Any, Optional[str]]:
+        """
+        GET a JSON resource, revalidating any cached copy with the server.
+
+        A cached ETag/Last-Modified is sent as If-None-Match/If-Modified-Since and
+        a 304 reply is answered from the cache; GitHub does not count 304s
+        against the rate limit.
+
+        Args:
+            url: Resource URL
+            params: Query parameters
+            not_found_ok: Return None on 404 instead of raising
+
+        Returns:
+            The decoded JSON body and the URL of the next page, if any
+        """
+        # Credentials are part of the key: another token may see different data
+        key = json.dumps([url, sorted((params or {}).items()), self.token])
+        cached = cache.get_response(key)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self._send("GET", url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached["body"], cached.get("next")
+        if response.status_code == 404 and not_found_ok:
+            return None, None
+        response.raise_for_status()
+
+        body = _loads(response.content)
+        # GitHub and GitLab both announce the following page in a Link header
+        next_url = response.links.get("next", {}).get("url")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            cache.put_response(key, {"etag": etag, "last_modified": last_modified, "body": body, "next": next_url})
+        return body, next_url
+
+    def close(self):
+        """Close the session's pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GitHubAPI(_APIClient):
     """Class for interacting with GitHub API."""
     
     def __init__(self, token: Optional[str] = None):
-        """Initialize with optional token."""
-        self.token = token or os.environ.get("GITHUB_TOKEN")
+        """
+        Initialize with optional token.
+
+        Without one, GITHUB_TOKEN is used; GITHUB_TOKENS may instead list several
+        comma-separated tokens to rotate between as their rate limits run down.
+        """
+        tokens = [t.strip() for t in os.environ.get("GITHUB_TOKENS", "").split(",") if t.strip()]
+        self.token = token or os.environ.get("GITHUB_TOKEN") or (tokens[0] if tokens else None)
         self.base_url = "https://api.github.com"
         self.headers = {
             "Accept": "application/vnd.github.v3+json"
         }
-        if self.token:
+        if not token and len(tokens) > 1:
+            self.token_pool = TokenPool(tokens)
+        elif self.token:
             self.headers["Authorization"] = f"token {self.token}"
+        self._start_session()
             
     def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
         """Get repository information."""
         url = f"{self.base_url}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._get(url)
         
-    def get_pull_requests(self, owner: str, repo: str, state: str = "all") -> List[Dict[str, Any]]:
+    def get_pull_requests(self, owner: str, repo: str, state: str = "all",
+                          max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get repository pull requests."""
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
         params = {"state": state}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_all(url, params=params, max_pages=max_pages)
         
     def get_pr_for_commit(self, owner: str, repo: str, commit_hash: str) -> Optional[Dict[str, Any]]:
         """Find the pull request associated with a commit."""
         url = f"{self.base_url}/repos/{owner}/{repo}/commits/{commit_hash}/pulls"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        prs = response.json()
+        prs = self._get(url, not_found_ok=True)
         return prs[0] if prs else None
         
     def get_reviews_for_pr(self, owner: str, repo: str, pr_number: int) -> List[Dict[str, Any]]:
         """Get reviews for a pull request."""
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._get_all(url)
         
     def get_review_comments(self, owner: str, repo: str, pr_number: int) -> List[Dict[str, Any]]:
         """Get review comments for a pull request."""
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls/{pr_number}/comments"
-        response = requests.get(url, headers=self.headers)
+        return self._get_all(url)
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL v4 query and return its `data`."""
+        response = self._send("POST", f"{self.base_url}/graphql", json={"query": query, "variables": variables or {}})
         response.raise_for_status()
-        return response.json()
+        result = _loads(response.content)
+        if result.get("errors"):
+            raise RuntimeError(result["errors"][0].get("message", "GraphQL query failed"))
+        return result["data"]
+
+    def get_review_comments_for_commits(self, owner: str, repo: str, commits: List[str]
+                                        ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Get the review comments of the pull requests that introduced the given
+        commits, with one GraphQL query per 100 commits and per 100 PRs. Requires
+        a token.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            commits: Full commit shas
+
+        Returns:
+            (pull request, review comments) pairs, shaped like the REST responses
+        """
+        numbers = {}
+        for start in range(0, len(commits), _GRAPHQL_BATCH_SIZE):
+            batch = commits[start:start + _GRAPHQL_BATCH_SIZE]
+            fields = "\n".join(
+                f'c{i}: object(oid: "{sha}") {{ ... on Commit {{ associatedPullRequests(first: 5) {{ nodes {{ number }} }} }} }}'
+                for i, sha in enumerate(batch)
+            )
+            data = self.graphql(
+                f"query($owner: String!, $repo: String!) {{ repository(owner: $owner, name: $repo) {{ {fields} }} }}",
+                {"owner": owner, "repo": repo}
+            )
+            for i in range(len(batch)):
+                # Commits GitHub has never seen come back as null
+                commit = data["repository"][f"c{i}"] or {}
+                for pr in commit.get("associatedPullRequests", {}).get("nodes", []):
+                    numbers.setdefault(pr["number"], None)
+
+        results = []
+        numbers = list(numbers)
+        for start in range(0, len(numbers), _GRAPHQL_BATCH_SIZE):
+            batch = numbers[start:start + _GRAPHQL_BATCH_SIZE]
+            fields = "\n".join(f"p{i}: pullRequest(number: {number}) {{ ...prReviewComments }}" for i, number in enumerate(batch))
+            data = self.graphql(
+                f"query($owner: String!, $repo: String!) {{ repository(owner: $owner, name: $repo) {{ {fields} }} }}"
+                + _PR_REVIEW_FRAGMENT,
+                {"owner": owner, "repo": repo}
+            )
+            nodes = [data["repository"][f"p{i}"] for i in range(len(batch))]
+            results.extend(self._review_comments_from_nodes(owner, repo, [node for node in nodes if node]))
+        return results
 
+    def _review_comments_from_nodes(self, owner: str, repo: str, nodes: List[Dict[str, Any]]
+                                    ) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Turn `prReviewComments` nodes into (pull request, comments) pairs shaped
+        like the REST responses. PRs with more threads or comments than the query
+        returned are re-fetched in full over REST.
+        """
+        results = []
+        truncated = []
+        for pr in nodes:
+            threads = pr["reviewThreads"]
+            if threads["pageInfo"]["hasNextPage"] or any(
+                thread["comments"]["pageInfo"]["hasNextPage"] for thread in threads["nodes"]
+            ):
+                truncated.append(len(results))
+            comments = [
+                {
+                    "body": c["body"],
+                    # Deleted accounts come back as a null author
+                    "user": {"login": (c["author"] or {}).get("login", "ghost")},
+                    "line": c["line"],
+                    "original_line": c["originalLine"],
+                    "created_at": c["createdAt"],
+                    "html_url": c["url"],
+                    "path": c["path"],
+                }
+                for thread in threads["nodes"]
+                for c in thread["comments"]["nodes"]
+            ]
+            results.append(({"number": pr["number"], "title": pr["title"]}, comments))
 
-class GitLabAPI:
+        if truncated:
+            with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+                full_comments = executor.map(
+                    lambda i: self.get_review_comments(owner, repo, results[i][0]["number"]), truncated
+                )
+                for i, comments in zip(truncated, full_comments):
+                    results[i] = (results[i][0], comments)
+        return results
+
+
+class GitLabAPI(_APIClient):
     """Class for interacting with GitLab API."""
     
     def __init__(self, token: Optional[str] = None, base_url: str = "https://gitlab.com/api/v4"):
@@ -73,40 +390,33 @@ class GitLabAPI:
         self.headers = {}
         if self.token:
             self.headers["PRIVATE-TOKEN"] = self.token
+        self._start_session()
             
     def get_repo_info(self, project_id: Union[str, int]) -> Dict[str, Any]:
         """Get repository information."""
         url = f"{self.base_url}/projects/{urllib.parse.quote_plus(str(project_id))}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._get(url)
         
-    def get_merge_requests(self, project_id: Union[str, int], state: str = "all") -> List[Dict[str, Any]]:
+    def get_merge_requests(self, project_id: Union[str, int], state: str = "all",
+                           max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get project merge requests."""
         url = f"{self.base_url}/projects/{urllib.parse.quote_plus(str(project_id))}/merge_requests"
         params = {"state": state}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_all(url, params=params, max_pages=max_pages)
         
     def get_mr_for_commit(self, project_id: Union[str, int], commit_hash: str) -> Optional[Dict[str, Any]]:
         """Find the merge request associated with a commit."""
         url = f"{self.base_url}/projects/{urllib.parse.quote_plus(str(project_id))}/repository/commits/{commit_hash}/merge_requests"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        mrs = response.json()
+        mrs = self._get(url, not_found_ok=True)
         return mrs[0] if mrs else None
         
     def get_merge_request_discussions(self, project_id: Union[str, int], mr_iid: int) -> List[Dict[str, Any]]:
         """Get discussions (comments) for a merge request."""
         url = f"{self.base_url}/projects/{urllib.parse.quote_plus(str(project_id))}/merge_requests/{mr_iid}/discussions"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._get_all(url)
 
 
+@lru_cache(maxsize=64)
 def parse_git_remote_url(remote_url: str) -> Dict[str, str]:
     """
     Parse a git remote URL to extract platform, owner, and repo.
@@ -122,44 +432,22 @@ def parse_git_remote_url(remote_url: str) -> Dict[str, str]:
         "owner": None,
         "repo": None
     }
-    
-    # Clean up the URL
-    if remote_url.endswith(".git"):
-        remote_url = remote_url[:-4]
-        
-    # Handle SSH URLs (git@github.com:owner/repo.git)
-    if remote_url.startswith("git@"):
-        parts = remote_url.split(":")
-        if len(parts) == 2:
-            host = parts[0].split("@")[1]
-            repo_path = parts[1]
-            
-            if "github.com" in host:
-                result["platform"] = "github"
-            elif "gitlab" in host:
-                result["platform"] = "gitlab"
-                
-            path_parts = repo_path.split("/")
-            if len(path_parts) >= 2:
-                result["owner"] = path_parts[0]
-                result["repo"] = "/".join(path_parts[1:])
-    
-    # Handle HTTPS URLs (https://github.com/owner/repo)
-    elif remote_url.startswith(("http://", "https://")):
-        parts = remote_url.split("/")
-        
-        if "github.com" in remote_url:
-            result["platform"] = "github"
-            if len(parts) >= 5:
-                result["owner"] = parts[3]
-                result["repo"] = "/".join(parts[4:])
-                
-        elif "gitlab" in remote_url:
-            result["platform"] = "gitlab"
-            if len(parts) >= 5:
-                result["owner"] = parts[3]
-                result["repo"] = "/".join(parts[4:])
-                
+
+    match = _REMOTE_URL_RE.match(remote_url)
+    if not match:
+        return result
+
+    # Match whole host labels so e.g. "notgitlab.example.com" is not GitLab
+    labels = match["host"].lower().split(".")
+    if labels[-2:] == ["github", "com"]:
+        result["platform"] = "github"
+    elif any(label.startswith("gitlab") for label in labels):
+        result["platform"] = "gitlab"
+    else:
+        return result
+
+    result["owner"] = match["owner"]
+    result["repo"] = match["repo"]
     return result
 
 
@@ -179,17 +467,10 @@ def get_pr_for_file_line(file_path: str, line_number: int) -> Optional[Dict[str,
         repo_dir = file_path.parent
         
         # Get commit hash for the line
-        blame_output = run_git_command(
-            ["git", "blame", f"-L{line_number},{line_number}", file_path.name],
-            cwd=repo_dir
-        )
-        commit_hash = blame_output.split()[0]
+        commit_hash, _, _ = get_blame_info(file_path, line_number)
         
         # Get repository remote URL
-        remote_url = run_git_command(
-            ["git", "config", "--get", "remote.origin.url"],
-            cwd=repo_dir
-        )
+        remote_url = get_remote_url(str(repo_dir))
         
         # Parse the remote URL to get platform, owner, and repo
         remote_info = parse_git_remote_url(remote_url)
@@ -199,16 +480,16 @@ def get_pr_for_file_line(file_path: str, line_number: int) -> Optional[Dict[str,
             
         # Get PR/MR information based on platform
         if remote_info["platform"] == "github":
-            github_api = GitHubAPI()
-            return github_api.get_pr_for_commit(
-                remote_info["owner"],
-                remote_info["repo"],
-                commit_hash
-            )
+            with GitHubAPI() as github_api:
+                return github_api.get_pr_for_commit(
+                    remote_info["owner"],
+                    remote_info["repo"],
+                    commit_hash
+                )
         elif remote_info["platform"] == "gitlab":
-            gitlab_api = GitLabAPI()
             project_path = f"{remote_info['owner']}/{remote_info['repo']}"
-            return gitlab_api.get_mr_for_commit(project_path, commit_hash)
+            with GitLabAPI() as gitlab_api:
+                return gitlab_api.get_mr_for_commit(project_path, commit_hash)
             
         return None
         
@@ -217,6 +498,39 @@ def get_pr_for_file_line(file_path: str, line_number: int) -> Optional[Dict[str,
         return None
 
 
+def _commits_touching(repo_root: str, relative_path: str, limit: int = _MAX_COMMIT_LOOKUPS) -> List[str]:
+    """
+    List the most recent commits that changed a file, from local history.
+
+    Only the first-parent line is followed, so a merged branch shows up once as
+    its merge commit rather than as every commit on it.
+    """
+    return run_git_command(
+        ["git", "log", "--first-parent", "--format=%H", f"--max-count={limit}", "--", relative_path],
+        cwd=repo_root
+    ).split()
+
+
+def _requests_for_commits(find_request, commits: List[str], id_key: str) -> List[Dict[str, Any]]:
+    """
+    Look up the PR/MR behind each commit concurrently.
+
+    Args:
+        find_request: Returns the PR/MR for a commit sha, or None
+        commits: Commit shas to look up
+        id_key: Field that identifies a PR/MR ("number" or "iid")
+
+    Returns:
+        Each PR/MR once, in the order of the first commit that led to it
+    """
+    found = {}
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        for request in executor.map(find_request, commits):
+            if request:
+                found.setdefault(request[id_key], request)
+    return list(found.values())
+
+
 def get_review_comments_for_file(file_path: str) -> List[Dict[str, Any]]:
     """
     Get review comments for a file across all PRs.
@@ -231,11 +545,9 @@ def get_review_comments_for_file(file_path: str) -> List[Dict[str, Any]]:
         file_path = Path(file_path).resolve()
         repo_dir = file_path.parent
         
-        # Get repository remote URL
-        remote_url = run_git_command(
-            ["git", "config", "--get", "remote.origin.url"],
-            cwd=repo_dir
-        )
+        # Get repository remote URL and root
+        remote_url = get_remote_url(str(repo_dir))
+        _, repo_root = get_branch_and_toplevel(str(repo_dir))
         
         # Parse the remote URL to get platform, owner, and repo
         remote_info = parse_git_remote_url(remote_url)
@@ -244,64 +556,83 @@ def get_review_comments_for_file(file_path: str) -> List[Dict[str, Any]]:
             return []
             
         # Get relative file path
-        repo_root = run_git_command(
-            ["git", "rev-parse", "--show-toplevel"],
-            cwd=repo_dir
-        )
         relative_path = str(file_path.relative_to(repo_root))
         
         all_comments = []
         
-        # Get PR/MR comments based on platform
+        # Get PR/MR comments based on platform. Each PR needs its own requests,
+        # so fetch them concurrently over the client's pooled connections.
         if remote_info["platform"] == "github":
-            github_api = GitHubAPI()
-            prs = github_api.get_pull_requests(remote_info["owner"], remote_info["repo"], state="all")
-            
-            for pr in prs:
-                comments = github_api.get_review_comments(
-                    remote_info["owner"],
-                    remote_info["repo"],
-                    pr["number"]
-                )
-                
-                # Filter comments for this file
-                file_comments = [
-                    {
-                        "body": c["body"],
-                        "author": c["user"]["login"],
-                        "line": c.get("line", c.get("original_line")),
-                        "date": c["created_at"],
-                        "pr_number": pr["number"],
-                        "pr_title": pr["title"],
-                        "url": c["html_url"]
-                    }
-                    for c in comments
-                    if c.get("path") == relative_path
-                ]
-                
-                all_comments.extend(file_comments)
+            with GitHubAPI() as github_api:
+                # Only PRs that changed the file can carry comments on it
+                commits = _commits_touching(repo_root, relative_path)
+                pr_comments = None
+                # GraphQL needs a token; without one, or if it lacks access, fall back to REST
+                if github_api.token:
+                    try:
+                        pr_comments = github_api.get_review_comments_for_commits(
+                            remote_info["owner"], remote_info["repo"], commits
+                        )
+                    except (*_HTTP_ERRORS, RuntimeError):
+                        pr_comments = None
+                if pr_comments is None:
+                    prs = _requests_for_commits(
+                        lambda sha: github_api.get_pr_for_commit(remote_info["owner"], remote_info["repo"], sha),
+                        commits,
+                        "number"
+                    )
+                    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+                        pr_comments = list(zip(prs, executor.map(
+                            lambda pr: github_api.get_review_comments(remote_info["owner"], remote_info["repo"], pr["number"]),
+                            prs
+                        )))
+
+                for pr, comments in pr_comments:
+                    # Filter comments for this file
+                    file_comments = [
+                        {
+                            "body": c["body"],
+                            "author": c["user"]["login"],
+                            "line": c.get("line", c.get("original_line")),
+                            "date": c["created_at"],
+                            "pr_number": pr["number"],
+                            "pr_title": pr["title"],
+                            "url": c["html_url"]
+                        }
+                        for c in comments
+                        if c.get("path") == relative_path
+                    ]
                 
+                    all_comments.extend(file_comments)
+
         elif remote_info["platform"] == "gitlab":
-            gitlab_api = GitLabAPI()
-            project_path = f"{remote_info['owner']}/{remote_info['repo']}"
-            mrs = gitlab_api.get_merge_requests(project_path, state="all")
-            
-            for mr in mrs:
-                discussions = gitlab_api.get_merge_request_discussions(project_path, mr["iid"])
-                
-                for discussion in discussions:
-                    for note in discussion.get("notes", []):
-                        if note.get("type") == "DiffNote" and note.get("position", {}).get("new_path") == relative_path:
-                            all_comments.append({
-                                "body": note["body"],
-                                "author": note["author"]["username"],
-                                "line": note["position"].get("new_line"),
-                                "date": note["created_at"],
-                                "mr_number": mr["iid"],
-                                "mr_title": mr["title"],
-                                "url": note["url"]
-                            })
-        
+            with GitLabAPI() as gitlab_api, ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+                project_path = f"{remote_info['owner']}/{remote_info['repo']}"
+                # Only MRs that changed the file can carry comments on it
+                mrs = _requests_for_commits(
+                    lambda sha: gitlab_api.get_mr_for_commit(project_path, sha),
+                    _commits_touching(repo_root, relative_path),
+                    "iid"
+                )
+                discussions_per_mr = executor.map(
+                    lambda mr: gitlab_api.get_merge_request_discussions(project_path, mr["iid"]),
+                    mrs
+                )
+
+                for mr, discussions in zip(mrs, discussions_per_mr):
+                    for discussion in discussions:
+                        for note in discussion.get("notes", []):
+                            if note.get("type") == "DiffNote" and note.get("position", {}).get("new_path") == relative_path:
+                                all_comments.append({
+                                    "body": note["body"],
+                                    "author": note["author"]["username"],
+                                    "line": note["position"].get("new_line"),
+                                    "date": note["created_at"],
+                                    "mr_number": mr["iid"],
+                                    "mr_title": mr["title"],
+                                    "url": note["url"]
+                                })
+
         return all_comments
         
     except Exception as e:
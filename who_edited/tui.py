@@ -4,13 +4,18 @@ from textual.reactive import reactive
 from textual.binding import Binding
 from pathlib import Path
 import asyncio
+import webbrowser
 
 from who_edited.git_tools import (
     get_blame_info, 
     get_commit_info, 
     get_line_content, 
     get_github_url,
-    get_blame_range
+    get_blame_entries,
+    get_full_blame,
+    batch_commit_info,
+    abbreviate_hashes,
+    blame_entry_date,
 )
 
 class CommitInfo(Static):
@@ -33,15 +38,50 @@ class FileViewer(Static):
     file_path = reactive("")
     current_line = reactive(1)
     content = reactive([])
+
+    # Fill the available space so the visible window, not the file, sets the height
+    DEFAULT_CSS = """
+    FileViewer {
+        height: 1fr;
+    }
+    """
+
+    # Seconds the cursor must rest on a line before its commit is looked up
+    LOOKUP_DELAY = 0.15
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = None
+        self._prefetch = None
+        # Filled in by the background prefetch: commit per line (index = line - 1)
+        # and the details of each of those commits
+        self._line_commits = None
+        self._commit_meta = {}
     
-    async def watch_current_line(self, line):
-        """Watch for line changes and update commit info."""
+    def watch_current_line(self, line):
+        """Watch for line changes and update commit info once the cursor settles."""
         if not self.file_path or not self.content:
             return
-            
+        if self._line_commits is not None and 1 <= line <= len(self._line_commits):
+            # Prefetched: a lookup is just an index, so there is nothing to debounce
+            if self._pending is not None:
+                self._pending.cancel()
+                self._pending = None
+            commit_info = self._commit_meta.get(self._line_commits[line - 1])
+            if commit_info is not None:
+                self.app.query_one(CommitInfo).commit_data = commit_info
+                return
+        # Holding an arrow key passes over many lines; only look up the last one
+        if self._pending is not None:
+            self._pending.cancel()
+        self._pending = asyncio.create_task(self._delayed_lookup(line))
+
+    async def _delayed_lookup(self, line):
+        await asyncio.sleep(self.LOOKUP_DELAY)
         try:
-            commit_hash, _, repo_dir = get_blame_info(self.file_path, line)
-            commit_info = get_commit_info(commit_hash, repo_dir)
+            # git runs in a worker thread so the event loop keeps handling keys
+            commit_hash, _, repo_dir = await asyncio.to_thread(get_blame_info, self.file_path, line)
+            commit_info = await asyncio.to_thread(get_commit_info, commit_hash, repo_dir)
             self.app.query_one(CommitInfo).commit_data = commit_info
         except Exception as e:
             self.app.query_one(CommitInfo).commit_data = {"message": f"Error: {e}"}
@@ -51,8 +91,11 @@ class FileViewer(Static):
         if not self.content:
             return "No file loaded"
             
+        # Only format the lines that fit on screen, centred on the cursor
+        height = self.size.height or 40
+        start = max(0, min(self.current_line - 1 - height // 2, len(self.content) - height))
         result = []
-        for i, line in enumerate(self.content, 1):
+        for i, line in enumerate(self.content[start:start + height], start + 1):
             if i == self.current_line:
                 result.append(f"[bold yellow]{i}: {line}[/]")
             else:
@@ -63,8 +106,27 @@ class FileViewer(Static):
     def load_file(self, path):
         """Load a file and its content."""
         self.file_path = str(path)
-        with open(path, "r") as f:
-            self.content = f.read().splitlines()
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            self.content = [line.rstrip("\r\n") for line in f]
+        self._line_commits = None
+        self._commit_meta = {}
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+        self._prefetch = asyncio.create_task(self._prefetch_blame(self.file_path))
+
+    async def _prefetch_blame(self, file_path):
+        """Blame the whole file once in the background so cursor moves need no git calls."""
+        try:
+            blame = await asyncio.to_thread(get_full_blame, file_path)
+            line_commits = [entry["hash"] for entry in blame]
+            repo_dir = Path(file_path).resolve().parent
+            commit_meta = await asyncio.to_thread(batch_commit_info, line_commits, repo_dir)
+        except Exception:
+            # Lookups fall back to blaming on demand
+            return
+        if file_path == self.file_path:
+            self._line_commits = line_commits
+            self._commit_meta = commit_meta
             
     def move_up(self):
         """Move cursor up one line."""
@@ -90,10 +152,9 @@ class BlameTable(DataTable):
         
     async def load_blame_data(self, file_path, line_range=None):
         """Load blame data for the specified file and line range."""
-        self.clear()
-        
         file_path = Path(file_path)
         if not file_path.exists():
+            self.clear()
             return
             
         if line_range is None:
@@ -101,32 +162,28 @@ class BlameTable(DataTable):
             line_range = "1-20"
             
         try:
-            blame_output = get_blame_range(file_path, line_range)
-            lines = blame_output.splitlines()
-            
-            for line in lines:
-                parts = line.split(")")
-                commit_info = parts[0] + ")"  # Everything before the first closing parenthesis
-                
-                # Extract line number (before the closing parenthesis)
-                line_number = commit_info.split()[-1].strip()
-                
-                # Extract author from between the first opening parenthesis and the next space
-                author = commit_info.split("(")[1].split()[0]
-                
-                # Extract date (YYYY-MM-DD) - simplified approach
-                date_parts = [part for part in commit_info.split() if "-" in part]
-                date = date_parts[0] if date_parts else "Unknown"
-                
-                # Extract commit hash (first part of the line)
-                commit_hash = commit_info.split()[0]
-                
-                # Extract content (everything after the closing parenthesis)
-                code_content = ")".join(parts[1:]).strip()
-                
-                self.add_row(line_number, author, date, commit_hash, code_content)
+            # Blame in a worker thread; the old rows stay up until the new ones are ready
+            entries = await asyncio.to_thread(get_blame_entries, file_path, line_range)
+            short_hashes = await asyncio.to_thread(
+                abbreviate_hashes, [entry["hash"] for entry in entries], file_path.resolve().parent
+            )
+            rows = []
+            # Hot commits own many lines; format each commit's columns once
+            commit_columns = {}
+            for entry in entries:
+                columns = commit_columns.get(entry["hash"])
+                if columns is None:
+                    columns = commit_columns[entry["hash"]] = (
+                        entry["author"], f"{blame_entry_date(entry):%Y-%m-%d}", short_hashes[entry["hash"]]
+                    )
+                rows.append((str(entry["line"]), *columns, entry["content"].strip()))
         except Exception as e:
-            self.add_row("Error", str(e), "", "", "")
+            rows = [("Error", str(e), "", "", "")]
+
+        # Swap the rows in with a single repaint instead of one per row
+        with self.app.batch_update():
+            self.clear()
+            self.add_rows(rows)
 
 
 class WhoEditedTUI(App):
@@ -176,11 +233,11 @@ class WhoEditedTUI(App):
         """Open the current file and line in browser (GitHub/GitLab)."""
         if self.file_path and self.view_mode == "file":
             try:
-                url = get_github_url(self.file_path, self.file_viewer.current_line)
-                import webbrowser
-                webbrowser.open(url)
+                # Both may block (git, launching a browser); keep the UI responsive
+                url = await asyncio.to_thread(get_github_url, self.file_path, self.file_viewer.current_line)
+                await asyncio.to_thread(webbrowser.open, url)
             except Exception as e:
-                self.commit_info.commit_data = {"message": f"Error opening URL: {e}"}
+                self.notify(f"Error opening URL: {e}", severity="error")
                 
     async def action_toggle_view(self):
         """Toggle between file view and blame table view."""